@@ -1,27 +1,42 @@
 import argparse
-import json
+import asyncio
 import logging
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.config import (
+    BI_ENCODER_MODEL_NAME,
     BI_ENCODER_RANKING_PATH,
+    CROSS_ENCODER_MODEL_NAME,
     DATA_DIR,
     FINAL_RANKING_PATH,
     JOB_DESCRIPTION_PATH,
+    MAX_CONCURRENT_REQUESTS,
     RESUMES_DIR,
     STRUCTURED_JOB_DESCRIPTION_PATH,
     STRUCTURED_RESUMES_PATH,
 )
+from src.extraction.batch_extract import batch_extract
 from src.extraction.job_description import extract_job_requirements
-from src.extraction.resume import extract_resume_details
-from src.models.encoders import get_bi_encoder, get_cross_encoder
+from src.extraction.resume import extract_resume_details_async
+from src.models.encoders import (
+    get_bi_encoder,
+    get_bi_encoder_onnx,
+    get_cross_encoder,
+    get_precision,
+)
 from src.ranking.bi_encoder import bi_encoder_resume_filtering
 from src.ranking.cross_encoder_llm import score_and_rank
+from src.ranking.embed_cache import get_or_compute
+from src.ranking.text_formatting import format_job_description, format_resume
+from src.utils.helpers import safe_get_nested
+from src.utils.json_io import read_json, write_json
 from src.utils.text_extractor import load_raw_resume_texts
 
 load_dotenv()
@@ -56,6 +71,10 @@ class ResumeRankingPipeline:
         job_description_path: Path = JOB_DESCRIPTION_PATH,
         resumes_dir: Path = RESUMES_DIR,
         data_dir: Path = DATA_DIR,
+        use_onnx: bool = False,
+        batch_mode: bool = False,
+        use_cache: bool = True,
+        hard_gate: bool = False,
     ):
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY environment variable not set.")
@@ -64,6 +83,9 @@ class ResumeRankingPipeline:
         self.resumes_dir = resumes_dir
         self.data_dir = data_dir
         self.data_dir.mkdir(exist_ok=True)
+        self.batch_mode = batch_mode
+        self.use_cache = use_cache
+        self.hard_gate = hard_gate
 
         # Default scoring metrics
         self.top_n = top_n
@@ -79,10 +101,33 @@ class ResumeRankingPipeline:
         # In-memory data
         self.structured_job_description: Dict[str, Any] = {}
         self.structured_resumes: List[Dict[str, Any]] = []
+        self.job_text: str | None = None
+        self.job_embedding: np.ndarray | None = None
+        self._formatted_resumes: Dict[str, str] = {}
+        self._candidate_names: Dict[str, str] = {}
+
+        # Models are loaded lazily, on first use
+        self.use_onnx = use_onnx
+
+        # Cache namespaces, kept apart per backend and precision
+        precision = get_precision()
+        precision_suffix = "" if precision == "fp32" else f"_{precision}"
+        self.bi_encoder_tag = (
+            f"{BI_ENCODER_MODEL_NAME}_onnx_qint8"
+            if use_onnx
+            else f"{BI_ENCODER_MODEL_NAME}{precision_suffix}"
+        )
+        self.cross_encoder_tag = f"{CROSS_ENCODER_MODEL_NAME}{precision_suffix}"
 
-        # Load models
-        self.bi_encoder_model = get_bi_encoder()
-        self.cross_encoder_model = get_cross_encoder()
+    @cached_property
+    def bi_encoder_model(self):
+        """The SentenceTransformer model for initial filtering, loaded on first use."""
+        return get_bi_encoder_onnx() if self.use_onnx else get_bi_encoder()
+
+    @cached_property
+    def cross_encoder_model(self):
+        """The CrossEncoder model for pairwise comparison, loaded on first use."""
+        return get_cross_encoder()
 
     def _extract_job_description(self):
         """
@@ -95,10 +140,11 @@ class ResumeRankingPipeline:
         with open(self.job_description_path) as f:
             job_description = f.read()
         self.structured_job_description = extract_job_requirements(
-            self.client, job_description
+            self.client, job_description, use_cache=self.use_cache
+        )
+        write_json(
+            self.structured_job_description_path, self.structured_job_description
         )
-        with open(self.structured_job_description_path, "w") as f:
-            json.dump(self.structured_job_description, f, indent=2)
         logging.info(
             f"Saved structured job description to {self.structured_job_description_path}"
         )
@@ -107,20 +153,154 @@ class ResumeRankingPipeline:
         """
         Extracts structured data from resumes.
 
-        Loads all resumes from the specified directory, processes each one
-        using OpenAI to extract structured information, and saves the
-        results to a JSON file.
+        Loads all resumes from the specified directory, processes them
+        concurrently using OpenAI to extract structured information, and
+        saves the results to a JSON file.
         """
         logging.info("Extracting structured data from resumes...")
         raw_resumes = load_raw_resume_texts(self.resumes_dir)
-        self.structured_resumes = [
-            extract_resume_details(self.client, resume)
-            for _, resume in raw_resumes.items()
-        ]
-        with open(self.structured_resumes_path, "w") as f:
-            json.dump(self.structured_resumes, f, indent=2)
+        structured_resumes = asyncio.run(
+            self._with_async_client(
+                self._extract_resume_details_concurrently,
+                [text for _, text in raw_resumes.values()],
+            )
+        )
+        self.structured_resumes = self._attach_resume_ids(
+            list(raw_resumes), structured_resumes
+        )
+        write_json(self.structured_resumes_path, self.structured_resumes)
         logging.info(f"Saved structured resumes to {self.structured_resumes_path}")
 
+    @staticmethod
+    def _attach_resume_ids(
+        resume_ids: List[str], structured_resumes: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Tags each structured resume with the stable id of its source file.
+
+        The id, rather than the extracted candidate name, joins candidates
+        across pipeline stages. Failed extractions are dropped.
+
+        Args:
+            resume_ids: The resume ids, in the same order as the structured resumes
+            structured_resumes: The extraction results
+
+        Returns:
+            list: The successfully extracted resumes with a `_resume_id` field
+        """
+        tagged = []
+        for resume_id, resume in zip(resume_ids, structured_resumes):
+            if not resume:
+                logging.warning(f"Skipping resume {resume_id}: extraction failed")
+                continue
+            tagged.append({**resume, "_resume_id": resume_id})
+        return tagged
+
+    async def _with_async_client(self, func, *args, **kwargs):
+        """
+        Awaits an async step with a fresh AsyncOpenAI client.
+
+        Each `asyncio.run` call creates a new event loop, and the client's
+        connection pool can't be shared across loops, so every async step
+        gets its own client.
+
+        Args:
+            func: The async callable to await, taking the client as its first argument
+            *args: Positional arguments passed to `func`
+            **kwargs: Keyword arguments passed to `func`
+
+        Returns:
+            The result of `func`
+        """
+        async with AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")) as client:
+            return await func(client, *args, **kwargs)
+
+    async def _extract_resume_details_concurrently(
+        self, client: AsyncOpenAI, resumes: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extracts structured data from all resumes with bounded concurrency.
+
+        Args:
+            client: The async OpenAI client used for the extraction requests
+            resumes: The raw resume texts
+
+        Returns:
+            list: The structured resumes, in the same order as the input texts
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        return await asyncio.gather(
+            *[
+                extract_resume_details_async(
+                    client, resume, semaphore, use_cache=self.use_cache
+                )
+                for resume in resumes
+            ]
+        )
+
+    def _batch_extract(self):
+        """
+        Extracts structured data from the job description and resumes in one batch.
+
+        Submits every extraction through the OpenAI Batch API, which halves the
+        cost at the price of latency, and saves the structured output to the
+        same JSON files as the per-request extraction steps.
+        """
+        logging.info("Extracting structured data via the OpenAI Batch API...")
+        with open(self.job_description_path) as f:
+            job_description = f.read()
+        raw_resumes = load_raw_resume_texts(self.resumes_dir)
+        self.structured_job_description, structured_resumes = batch_extract(
+            self.client,
+            job_description,
+            [text for _, text in raw_resumes.values()],
+            use_cache=self.use_cache,
+        )
+        self.structured_resumes = self._attach_resume_ids(
+            list(raw_resumes), structured_resumes
+        )
+        write_json(
+            self.structured_job_description_path, self.structured_job_description
+        )
+        write_json(self.structured_resumes_path, self.structured_resumes)
+        logging.info(
+            f"Saved structured job description to {self.structured_job_description_path}"
+        )
+        logging.info(f"Saved structured resumes to {self.structured_resumes_path}")
+
+    def _format_structured_data(self):
+        """
+        Formats the structured job description and resumes into text once.
+
+        The formatted texts are shared by the bi-encoder and cross-encoder
+        stages, so each resume is formatted exactly once per run.
+        """
+        self.job_text = format_job_description(self.structured_job_description)
+        self._formatted_resumes = {
+            resume["_resume_id"]: format_resume(resume)
+            for resume in self.structured_resumes
+        }
+        self._candidate_names = {
+            resume["_resume_id"]: safe_get_nested(resume, "contact_info", "name")
+            or "Unknown Candidate"
+            for resume in self.structured_resumes
+        }
+
+    def _embed_job_description(self):
+        """
+        Embeds the formatted job description once with the bi-encoder.
+
+        The embedding is kept on the pipeline so later stages reuse it
+        instead of re-encoding the job description.
+        """
+        self.job_embedding = get_or_compute(
+            self.bi_encoder_model,
+            [self.job_text],
+            self.bi_encoder_tag,
+            use_cache=self.use_cache,
+            normalize_embeddings=True,
+        )[0]
+
     def _filter_with_bi_encoder(self):
         """
         Filters resumes using a bi-encoder model.
@@ -131,12 +311,15 @@ class ResumeRankingPipeline:
         """
         logging.info("Filtering resumes with bi-encoder...")
         bi_encoder_ranking = bi_encoder_resume_filtering(
-            self.structured_job_description,
-            self.structured_resumes,
+            self.job_text,
+            self._formatted_resumes,
+            self._candidate_names,
             self.bi_encoder_model,
+            model_tag=self.bi_encoder_tag,
+            job_embedding=self.job_embedding,
+            use_cache=self.use_cache,
         )
-        with open(self.bi_encoder_ranking_path, "w") as f:
-            json.dump(bi_encoder_ranking, f, indent=2)
+        write_json(self.bi_encoder_ranking_path, bi_encoder_ranking)
         logging.info(f"Saved bi-encoder ranking to {self.bi_encoder_ranking_path}")
 
     def _load_bi_encoder_ranking(self):
@@ -146,8 +329,7 @@ class ResumeRankingPipeline:
         Returns:
             list: The previously computed bi-encoder ranking results
         """
-        with open(self.bi_encoder_ranking_path, "r") as f:
-            return json.load(f)
+        return read_json(self.bi_encoder_ranking_path)
 
     def _score_and_rank(self):
         """
@@ -160,18 +342,25 @@ class ResumeRankingPipeline:
         """
         logging.info("Scoring and ranking with cross-encoder and LLM...")
         bi_encoder_ranking = self._load_bi_encoder_ranking()
-        final_ranking = score_and_rank(
-            client=self.client,
-            bi_encoder_ranking=bi_encoder_ranking,
-            structured_resumes=self.structured_resumes,
-            structured_job_description=self.structured_job_description,
-            cross_encoder_model=self.cross_encoder_model,
-            top_n=self.top_n,
-            llm_weight=self.llm_weights,
-            cross_encoder_weight=self.cross_encoder_weight,
+        final_ranking = asyncio.run(
+            self._with_async_client(
+                score_and_rank,
+                bi_encoder_ranking=bi_encoder_ranking,
+                structured_resumes=self.structured_resumes,
+                structured_job_description=self.structured_job_description,
+                job_text=self.job_text,
+                resume_texts=self._formatted_resumes,
+                cross_encoder_model=self.cross_encoder_model,
+                top_n=self.top_n,
+                llm_weight=self.llm_weights,
+                cross_encoder_weight=self.cross_encoder_weight,
+                cross_encoder_tag=self.cross_encoder_tag,
+                batch_client=self.client if self.batch_mode else None,
+                use_cache=self.use_cache,
+                hard_gate=self.hard_gate,
+            )
         )
-        with open(self.final_ranking_path, "w") as f:
-            json.dump(final_ranking, f, indent=2)
+        write_json(self.final_ranking_path, final_ranking)
         logging.info(f"Saved final ranking to {self.final_ranking_path}")
 
     def run(self):
@@ -183,9 +372,22 @@ class ResumeRankingPipeline:
         2. Extract structured data from all resumes
         3. Filters resumes using the bi-encoder.
         4. Scores and ranks the top candidates.
+
+        In batch mode, steps 1 and 2 are submitted together through the
+        OpenAI Batch API, and so are the LLM judgments of step 4. If no resume
+        could be extracted, the ranking steps are skipped without loading the
+        encoder models.
         """
-        self._extract_job_description()
-        self._extract_resume_details()
+        if self.batch_mode:
+            self._batch_extract()
+        else:
+            self._extract_job_description()
+            self._extract_resume_details()
+        if not self.structured_resumes:
+            logging.warning("No structured resumes available, skipping ranking.")
+            return
+        self._format_structured_data()
+        self._embed_job_description()
         self._filter_with_bi_encoder()
         self._score_and_rank()
         logging.info("Resume ranking pipeline completed successfully.")
@@ -237,6 +439,38 @@ def main():
         default=DATA_DIR,
         help="Directory to store intermediate and final results.",
     )
+    parser.add_argument(
+        "--onnx",
+        action="store_true",
+        help=(
+            "Use an int8-quantized ONNX Runtime bi-encoder"
+            " (requires optimum[onnxruntime])."
+        ),
+    )
+    parser.add_argument(
+        "--batch-mode",
+        action="store_true",
+        help=(
+            "Submit extraction and judging requests through the OpenAI Batch API"
+            " (cheaper, slower)."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Recompute cached extraction, LLM-as-a-judge, embedding and"
+            " cross-encoder results instead of reusing them."
+        ),
+    )
+    parser.add_argument(
+        "--hard-gate",
+        action="store_true",
+        help=(
+            "Score candidates missing a must-have skill or tool without calling"
+            " the LLM judge."
+        ),
+    )
     args = parser.parse_args()
 
     pipeline = ResumeRankingPipeline(
@@ -246,6 +480,10 @@ def main():
         job_description_path=args.job_description,
         resumes_dir=args.resumes_dir,
         data_dir=args.data_dir,
+        use_onnx=args.onnx,
+        batch_mode=args.batch_mode,
+        use_cache=not args.no_cache,
+        hard_gate=args.hard_gate,
     )
     pipeline.run()
 
@@ -12,6 +12,10 @@ setup(
         'pandas',
         'numpy',
         'scikit-learn',
+        'scipy',
         'tqdm',
     ],
+    extras_require={
+        'fast': ['orjson', 'pypdfium2'],
+    },
 )
\ No newline at end of file
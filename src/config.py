@@ -9,3 +9,25 @@ STRUCTURED_JOB_DESCRIPTION_PATH = DATA_DIR / "structured_job_description.json"
 STRUCTURED_RESUMES_PATH = DATA_DIR / "structured_resumes.json"
 BI_ENCODER_RANKING_PATH = DATA_DIR / "bi_encoder_ranking.json"
 FINAL_RANKING_PATH = DATA_DIR / "final_resume_ranking.json"
+EMBED_CACHE_DIR = DATA_DIR / "embed_cache"
+EXTRACT_CACHE_DIR = DATA_DIR / "extract_cache"
+JUDGE_CACHE_DIR = DATA_DIR / "judge_cache"
+
+OPENAI_MODEL_NAME = "gpt-4.1-nano"
+
+BI_ENCODER_MODEL_NAME = "all-MiniLM-L6-v2"
+CROSS_ENCODER_MODEL_NAME = "cross-encoder/ms-marco-MiniLM-L6-v2"
+# One of "fp32", "fp16" (CUDA only) or "bf16"; unset picks fp16 on CUDA, else fp32
+PRECISION_ENV_VAR = "RESUME_RANKER_PRECISION"
+# Set to "1" to compile the encoder models with torch.compile
+TORCH_COMPILE_ENV_VAR = "RESUME_RANKER_TORCH_COMPILE"
+
+MAX_CONCURRENT_REQUESTS = 10
+BATCH_POLL_INTERVAL_SECONDS = 30
+
+# Character budgets for long resume fields sent to the LLM judge, see `trim_resume`
+JUDGE_FIELD_CHAR_LIMITS = {
+    "professional_summary": 500,
+    "achievements": 400,
+    "description": 300,
+}
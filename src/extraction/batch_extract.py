@@ -0,0 +1,146 @@
+import logging
+
+from openai import OpenAI
+
+from src.config import OPENAI_MODEL_NAME
+from src.extraction.cache import (
+    JOB_DESCRIPTION_KIND,
+    RESUME_KIND,
+    extraction_cache_key,
+    load_cached_extraction,
+    save_cached_extraction,
+)
+from src.extraction.job_description import JOB_EXTRACTION_PROMPT, JOB_PROMPT_VERSION
+from src.extraction.resume import RESUME_EXTRACTION_PROMPT, RESUME_PROMPT_VERSION
+from src.models.schema import ExtractedJobRequirements, StructuredResume
+from src.utils.openai_batch import run_batch, strict_json_schema
+
+JOB_DESCRIPTION_ID = "job_description"
+
+# Built once at import, rather than for every request line
+RESPONSE_FORMATS = {
+    model_class: {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model_class.__name__,
+            "schema": strict_json_schema(model_class),
+            "strict": True,
+        },
+    }
+    for model_class in (ExtractedJobRequirements, StructuredResume)
+}
+
+
+def _build_request(custom_id: str, system_prompt: str, text: str, model_class) -> dict:
+    """
+    Build a single Batch API request line for a structured extraction.
+
+    Args:
+        custom_id (str): Identifier used to match the result back to its input
+        system_prompt (str): The extraction instructions
+        text (str): The raw text to extract from
+        model_class: The Pydantic model describing the expected output
+
+    Returns:
+        dict: A `/v1/chat/completions` batch request line
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": OPENAI_MODEL_NAME,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": text},
+            ],
+            "response_format": RESPONSE_FORMATS[model_class],
+        },
+    }
+
+
+def _parse_response(custom_id: str, body: dict | None, model_class) -> dict:
+    """
+    Parse the structured output of a chat completion batch result.
+
+    Args:
+        custom_id (str): Identifier of the request, used for logging
+        body (dict | None): The chat completion response body, if the request succeeded
+        model_class: The Pydantic model the output is validated against
+
+    Returns:
+        dict: The parsed structured output conforming to `model_class`.
+              Returns an empty dict if parsing or validation fails.
+    """
+    try:
+        content = body["choices"][0]["message"]["content"]
+        return model_class.model_validate_json(content).model_dump()
+    except Exception as e:
+        logging.error(f"Failed to parse batch extraction result {custom_id}: {e}")
+        return {}
+
+
+def batch_extract(
+    client: OpenAI, job_description: str, resumes: list[str], use_cache: bool = True
+) -> tuple[dict, list[dict]]:
+    """
+    Extract structured data from a job description and resumes via the OpenAI Batch API.
+
+    All extractions are independent, so they are submitted together as a single
+    batch. This halves the API cost and avoids per-request rate limits, at the
+    price of latency (batches can take up to 24 hours to complete). Texts with a
+    cached extraction are left out of the batch.
+
+    Args:
+        client (OpenAI): An initialized OpenAI client instance
+        job_description (str): The raw text of the job description
+        resumes (list[str]): The raw texts of the resumes
+        use_cache (bool): Whether to reuse cached extractions of the same texts
+
+    Returns:
+        tuple[dict, list[dict]]: The structured job requirements matching the
+            ExtractedJobRequirements schema, and the structured resumes matching the
+            StructuredResume schema in the same order as the input. Failed
+            extractions are returned as empty dicts.
+    """
+    resume_ids = [f"resume_{i}" for i in range(len(resumes))]
+    inputs = {
+        JOB_DESCRIPTION_ID: (
+            JOB_DESCRIPTION_KIND,
+            job_description,
+            JOB_EXTRACTION_PROMPT,
+            JOB_PROMPT_VERSION,
+            ExtractedJobRequirements,
+        )
+    }
+    for resume_id, resume in zip(resume_ids, resumes):
+        inputs[resume_id] = (
+            RESUME_KIND,
+            resume,
+            RESUME_EXTRACTION_PROMPT,
+            RESUME_PROMPT_VERSION,
+            StructuredResume,
+        )
+
+    results = {}
+    cache_keys = {}
+    requests = []
+    for custom_id, (kind, text, prompt, prompt_version, model_class) in inputs.items():
+        cache_keys[custom_id] = extraction_cache_key(kind, text, prompt_version)
+        cached = load_cached_extraction(cache_keys[custom_id]) if use_cache else None
+        if cached is not None:
+            results[custom_id] = cached
+        else:
+            requests.append(_build_request(custom_id, prompt, text, model_class))
+
+    if requests:
+        responses = run_batch(client, requests, endpoint="/v1/chat/completions")
+        for request in requests:
+            custom_id = request["custom_id"]
+            model_class = inputs[custom_id][-1]
+            results[custom_id] = _parse_response(
+                custom_id, responses.get(custom_id), model_class
+            )
+            save_cached_extraction(cache_keys[custom_id], results[custom_id])
+
+    return results[JOB_DESCRIPTION_ID], [results[r] for r in resume_ids]
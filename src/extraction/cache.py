@@ -0,0 +1,57 @@
+import hashlib
+
+from src.config import EXTRACT_CACHE_DIR, OPENAI_MODEL_NAME
+from src.utils.json_cache import load_cached_json, save_cached_json
+
+# Kinds of extraction, keeping their cache entries apart
+JOB_DESCRIPTION_KIND = "job_description"
+RESUME_KIND = "resume"
+
+
+def extraction_cache_key(
+    kind: str, text: str, prompt_version: str, model_name: str = OPENAI_MODEL_NAME
+) -> str:
+    """
+    Compute the cache key for a structured extraction.
+
+    The key covers the kind of extraction, the raw input text, the model, and
+    the prompt version, so bumping the prompt version of one kind invalidates
+    every cached extraction of that kind only.
+
+    Args:
+        kind (str): The kind of extraction, JOB_DESCRIPTION_KIND or RESUME_KIND
+        text (str): The raw text being extracted from
+        prompt_version (str): Version of the extraction prompt and schema
+        model_name (str): The OpenAI model performing the extraction
+
+    Returns:
+        str: The kind followed by the SHA-256 hex digest identifying the extraction
+    """
+    digest = hashlib.sha256(
+        "\x00".join((kind, text, model_name, prompt_version)).encode()
+    ).hexdigest()
+    return f"{kind}_{digest}"
+
+
+def load_cached_extraction(key: str) -> dict | None:
+    """
+    Load a previously cached extraction result.
+
+    Args:
+        key (str): The cache key from `extraction_cache_key`
+
+    Returns:
+        dict | None: The cached structured output, or None on a cache miss
+    """
+    return load_cached_json(EXTRACT_CACHE_DIR, key)
+
+
+def save_cached_extraction(key: str, result: dict):
+    """
+    Cache an extraction result on disk. Failed (empty) extractions are not cached.
+
+    Args:
+        key (str): The cache key from `extraction_cache_key`
+        result (dict): The structured output to cache
+    """
+    save_cached_json(EXTRACT_CACHE_DIR, key, result)
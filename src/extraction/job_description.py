@@ -1,12 +1,29 @@
-import json
 import logging
 
 from openai import OpenAI
 
+from src.config import OPENAI_MODEL_NAME
+from src.extraction.cache import (
+    JOB_DESCRIPTION_KIND,
+    extraction_cache_key,
+    load_cached_extraction,
+    save_cached_extraction,
+)
 from src.models.schema import ExtractedJobRequirements
 
+# Bump when the prompt or the ExtractedJobRequirements schema changes
+JOB_PROMPT_VERSION = "1"
 
-def extract_job_requirements(client: OpenAI, job_description: str) -> dict:
+JOB_EXTRACTION_PROMPT = """
+    You are a job description analyzer. 
+    Extract the key requirements from this job description into these categories:
+    Make sure to expand all abbreviations.
+    """
+
+
+def extract_job_requirements(
+    client: OpenAI, job_description: str, use_cache: bool = True
+) -> dict:
     """
     Extract structured requirements from a job description using the OpenAI API.
 
@@ -18,6 +35,7 @@ def extract_job_requirements(client: OpenAI, job_description: str) -> dict:
     Args:
         client (OpenAI): An initialized OpenAI client instance
         job_description (str): The raw text of the job description to be analyzed
+        use_cache (bool): Whether to reuse a cached extraction of the same text
 
     Returns:
         dict: A dictionary containing the structured job requirements matching the
@@ -27,22 +45,25 @@ def extract_job_requirements(client: OpenAI, job_description: str) -> dict:
         If an error occurs during extraction, the error is printed to stdout and
         an empty dictionary is returned.
     """
-    job_extraction_system_prompt = """
-    You are a job description analyzer. 
-    Extract the key requirements from this job description into these categories:
-    Make sure to expand all abbreviations.
-    """
+    cache_key = extraction_cache_key(
+        JOB_DESCRIPTION_KIND, job_description, JOB_PROMPT_VERSION
+    )
+    if use_cache:
+        cached = load_cached_extraction(cache_key)
+        if cached is not None:
+            return cached
     try:
         response = client.responses.parse(
-            model="gpt-4.1-nano",
+            model=OPENAI_MODEL_NAME,
             input=[
-                {"role": "system", "content": job_extraction_system_prompt},
+                {"role": "system", "content": JOB_EXTRACTION_PROMPT},
                 {"role": "user", "content": job_description},
             ],
             text_format=ExtractedJobRequirements,
         )
-        result = json.loads(response.output_text)
-        return result
+        result = response.output_parsed.model_dump()
     except Exception as e:
         logging.error(f"Failed to extract job requirements: {e}")
         return {}
+    save_cached_extraction(cache_key, result)
+    return result
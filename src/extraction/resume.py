@@ -1,48 +1,73 @@
-import json
+import asyncio
 import logging
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
+from src.config import OPENAI_MODEL_NAME
+from src.extraction.cache import (
+    RESUME_KIND,
+    extraction_cache_key,
+    load_cached_extraction,
+    save_cached_extraction,
+)
 from src.models.schema import StructuredResume
+from src.utils.async_helpers import retry_with_backoff
 
+# Bump when the prompt or the StructuredResume schema changes
+RESUME_PROMPT_VERSION = "1"
 
-def extract_resume_details(client: OpenAI, resume: str) -> dict:
+RESUME_EXTRACTION_PROMPT = """
+    You are a resume analyzer. 
+    Extract the key infomation into these categories:
+    Make sure to expand all abbreviations.
+    Set unavailable information as None
+    """
+
+
+async def extract_resume_details_async(
+    client: AsyncOpenAI,
+    resume: str,
+    semaphore: asyncio.Semaphore,
+    use_cache: bool = True,
+) -> dict:
     """
     Extract structured information from a resume using the OpenAI API.
 
     This function parses raw resume text and extracts key information into a structured format
-    defined by the StructuredResume schema. It uses OpenAI's parsing capabilities to
-    categorize resume content including contact information, skills, work experience,
-    education, and certifications.
+    defined by the StructuredResume schema, including contact information, skills, work
+    experience, education, and certifications. The OpenAI API is awaited so that many
+    resumes can be extracted concurrently. The semaphore bounds the number of
+    in-flight requests, and rate-limited requests are retried with exponential backoff.
 
     Args:
-        client (OpenAI): An initialized OpenAI client instance
+        client (AsyncOpenAI): An initialized async OpenAI client instance
         resume (str): The raw text of the resume to be analyzed
+        semaphore (asyncio.Semaphore): Limits the number of concurrent requests
+        use_cache (bool): Whether to reuse a cached extraction of the same text
 
     Returns:
         dict: A dictionary containing the structured resume information matching the
               StructuredResume schema. Returns an empty dict if extraction fails.
-
-    Note:
-        If an error occurs during extraction, the error is printed to stdout and
-        an empty dictionary is returned.
-    """
-    resume_details_extraction_prompt = """
-    You are a resume analyzer. 
-    Extract the key infomation into these categories:
-    Make sure to expand all abbreviations.
-    Set unavailable information as None
     """
+    cache_key = extraction_cache_key(RESUME_KIND, resume, RESUME_PROMPT_VERSION)
+    if use_cache:
+        cached = load_cached_extraction(cache_key)
+        if cached is not None:
+            return cached
     try:
-        response = client.responses.parse(
-            model="gpt-4.1-nano",
-            input=[
-                {"role": "system", "content": resume_details_extraction_prompt},
-                {"role": "user", "content": resume},
-            ],
-            text_format=StructuredResume,
-        )
-        return json.loads(response.output_text)
+        async with semaphore:
+            response = await retry_with_backoff(
+                client.responses.parse,
+                model=OPENAI_MODEL_NAME,
+                input=[
+                    {"role": "system", "content": RESUME_EXTRACTION_PROMPT},
+                    {"role": "user", "content": resume},
+                ],
+                text_format=StructuredResume,
+            )
+        result = response.output_parsed.model_dump()
     except Exception as e:
         logging.error(f"Failed to extract resume details: {e}")
         return {}
+    save_cached_extraction(cache_key, result)
+    return result
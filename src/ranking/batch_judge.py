@@ -0,0 +1,108 @@
+import logging
+
+from openai import OpenAI
+
+from src.config import OPENAI_MODEL_NAME
+from src.models.schema import LLMJudgment
+from src.ranking.llm_cache import (
+    judgment_cache_key,
+    load_cached_judgment,
+    save_cached_judgment,
+)
+from src.ranking.llm_judge import JUDGMENT_TEXT_FORMAT, build_judge_input
+from src.utils.openai_batch import run_batch
+
+
+def _build_request(
+    custom_id: str, job_requirements_json: str, resume_info: dict
+) -> dict:
+    """
+    Build a single Batch API request line judging one resume.
+
+    Args:
+        custom_id (str): Identifier used to match the result back to its resume
+        job_requirements_json (str): Structured job requirements data, serialized
+                                     with `to_prompt_json`
+        resume_info (dict): Structured resume data to evaluate
+
+    Returns:
+        dict: A `/v1/responses` batch request line
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/responses",
+        "body": {
+            "model": OPENAI_MODEL_NAME,
+            "input": build_judge_input(job_requirements_json, resume_info),
+            "text": {"format": JUDGMENT_TEXT_FORMAT},
+        },
+    }
+
+
+def _parse_response(custom_id: str, body: dict | None) -> dict:
+    """
+    Parse the structured judgment out of a Responses API batch result.
+
+    Args:
+        custom_id (str): Identifier of the request, used for logging
+        body (dict | None): The response body, if the request succeeded
+
+    Returns:
+        dict: The parsed judgment conforming to the LLMJudgment schema.
+              Returns an empty dict if parsing fails.
+    """
+    try:
+        output_text = "".join(
+            content["text"]
+            for item in body["output"]
+            if item["type"] == "message"
+            for content in item["content"]
+            if content["type"] == "output_text"
+        )
+        return LLMJudgment.model_validate_json(output_text).model_dump()
+    except Exception as e:
+        logging.error(f"Failed to parse batch judgment {custom_id}: {e}")
+        return {}
+
+
+def batch_judge(
+    client: OpenAI,
+    job_requirements_json: str,
+    resumes: list[dict],
+    use_cache: bool = True,
+) -> list[dict]:
+    """
+    Evaluate resumes against job requirements through the OpenAI Batch API.
+
+    Meant for offline ranking runs: the Batch API halves the cost and has
+    higher rate limits than synchronous requests, but results can take up to
+    24 hours. Resumes with a cached judgment are left out of the batch.
+
+    Args:
+        client (OpenAI): An initialized OpenAI client
+        job_requirements_json (str): Structured job requirements data, serialized
+                                     with `to_prompt_json`
+        resumes (list[dict]): Structured resume data to evaluate
+        use_cache (bool): Whether to reuse cached judgments of the same inputs
+
+    Returns:
+        list[dict]: One evaluation result per resume, in the same order as the
+                    input, conforming to the LLMJudgment schema. Failed
+                    evaluations are returned as empty dicts.
+    """
+    cache_keys = [judgment_cache_key(job_requirements_json, r) for r in resumes]
+    results = [load_cached_judgment(key) if use_cache else None for key in cache_keys]
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    if pending:
+        requests = [
+            _build_request(f"judgment_{i}", job_requirements_json, resumes[i])
+            for i in pending
+        ]
+        responses = run_batch(client, requests, endpoint="/v1/responses")
+        for i in pending:
+            custom_id = f"judgment_{i}"
+            results[i] = _parse_response(custom_id, responses.get(custom_id))
+            save_cached_judgment(cache_keys[i], results[i])
+    return results
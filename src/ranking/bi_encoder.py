@@ -1,46 +1,73 @@
-from sentence_transformers import util
+import numpy as np
 
-from src.ranking.text_formatting import format_job_description, format_resume
-from src.utils.helpers import safe_get_nested
+from src.config import BI_ENCODER_MODEL_NAME
+from src.ranking.embed_cache import get_or_compute
 
 
 def bi_encoder_resume_filtering(
-    structured_job_description: dict,
-    structured_candidate_resumes: list[dict],
+    job_text: str,
+    resume_texts: dict[str, str],
+    candidate_names: dict[str, str],
     bi_encoder_model,
+    model_tag: str = BI_ENCODER_MODEL_NAME,
+    job_embedding: np.ndarray | None = None,
+    use_cache: bool = True,
 ) -> list[dict]:
     """
     Filter and rank resumes based on similarity to job description using a bi-encoder model.
 
     This function compares each resume against the job description by:
-    1. Converting both job description and resume to text format
-    2. Generating embeddings for both texts using the bi-encoder model
-    3. Calculating cosine similarity between the embeddings
-    4. Ranking candidates based on similarity scores
+    1. Encoding the job description once and all resumes in a single batched call,
+       reusing embeddings cached on disk for unchanged texts
+    2. Calculating cosine similarity as one matrix product over normalized embeddings
+    3. Ranking candidates based on similarity scores
 
     Args:
-        structured_job_description (dict): The structured job description data
-        structured_candidate_resumes (list[dict]): A list of structured candidate resume data
+        job_text (str): The formatted job description, see `format_job_description`
+        resume_texts (dict[str, str]): Formatted resumes keyed by resume id,
+                                       see `format_resume`
+        candidate_names (dict[str, str]): Candidate names keyed by resume id
         bi_encoder_model: The SentenceTransformer model to use for generating embeddings
+        model_tag (str): Identifier of the bi-encoder, used as the embedding cache namespace
+        job_embedding (np.ndarray | None): The normalized embedding of `job_text`, if
+                                           already computed by the caller
+        use_cache (bool): Whether to reuse embeddings cached on disk
 
     Returns:
-        list[dict]: A list of dictionaries containing candidate names and their similarity
-                   scores, sorted in descending order by score
+        list[dict]: A list of dictionaries containing resume ids, candidate names and
+                   their similarity scores, sorted in descending order by score
     """
-    job_des_text = format_job_description(structured_job_description)
+    resume_ids = list(resume_texts)
+    texts = list(resume_texts.values())
 
-    results = []
-    for candidate_data in structured_candidate_resumes:
-        resume_text = format_resume(candidate_data)
+    if job_embedding is None:
+        job_embedding = get_or_compute(
+            bi_encoder_model,
+            [job_text],
+            model_tag,
+            use_cache=use_cache,
+            normalize_embeddings=True,
+        )[0]
+    # encode() sorts inputs by length internally and restores the original order,
+    # so a large batch keeps padding to the longest resume in each mini-batch
+    resume_embs = get_or_compute(
+        bi_encoder_model,
+        texts,
+        model_tag,
+        use_cache=use_cache,
+        batch_size=max(1, min(len(texts), 128)),
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+    # embeddings are unit-length, so cosine similarity reduces to a dot product
+    scores = resume_embs @ job_embedding
+    order = np.argsort(-scores, kind="stable")
 
-        embeddings = bi_encoder_model.encode(
-            [job_des_text, resume_text], convert_to_tensor=True
-        )
-        score = util.pytorch_cos_sim(embeddings[0], embeddings[1]).item()
-
-        candidate_name = safe_get_nested(
-            candidate_data, "contact_info", "name", default="Unknown Candidate"
-        )
-        results.append({"candidate_name": candidate_name, "rank": score})
-
-    return sorted(results, key=lambda x: x["rank"], reverse=True)
+    return [
+        {
+            "resume_id": resume_ids[i],
+            "candidate_name": candidate_names[resume_ids[i]],
+            "rank": float(scores[i]),
+        }
+        for i in order
+    ]
@@ -1,21 +1,31 @@
-import math
+import asyncio
 
-from openai import OpenAI
+import numpy as np
+from openai import AsyncOpenAI, OpenAI
+from scipy.special import expit
 
-from src.ranking.llm_judge import llm_as_a_judge
-from src.ranking.text_formatting import format_job_description, format_resume
-from src.utils.helpers import safe_get_nested
+from src.config import CROSS_ENCODER_MODEL_NAME
+from src.ranking.batch_judge import batch_judge
+from src.ranking.embed_cache import get_or_predict
+from src.ranking.llm_judge import judge_all, to_prompt_json
+from src.ranking.prefilter import hard_gate as apply_hard_gate
 
 
-def score_and_rank(
-    client: OpenAI,
+async def score_and_rank(
+    client: AsyncOpenAI,
     bi_encoder_ranking: list[dict],
     structured_resumes: list[dict],
     structured_job_description: dict,
+    job_text: str,
+    resume_texts: dict[str, str],
     cross_encoder_model,
     top_n: int = 3,
     llm_weight: float = 0.7,
     cross_encoder_weight: float = 0.3,
+    cross_encoder_tag: str = CROSS_ENCODER_MODEL_NAME,
+    batch_client: OpenAI | None = None,
+    use_cache: bool = True,
+    hard_gate: bool = False,
 ) -> list[dict]:
     """
     Score and rank candidates using a combination of cross-encoder and LLM evaluation.
@@ -25,70 +35,113 @@ def score_and_rank(
     1. An LLM judge to evaluate detailed matching against job requirements
     2. A cross-encoder model for direct pairwise similarity scoring
 
-    The final ranking combines both scores with specified weights.
+    The LLM judgments are requested concurrently, while the cross-encoder scores
+    all pairs in a worker thread. The final ranking combines both scores with
+    specified weights.
 
     Args:
-        client (OpenAI): An initialized OpenAI client
+        client (AsyncOpenAI): An initialized async OpenAI client
         bi_encoder_ranking (list[dict]): Initial ranking from bi-encoder
-        structured_resumes (list[dict]): List of structured resume data
+        structured_resumes (list[dict]): List of structured resume data, each carrying
+                                         its stable `_resume_id`
         structured_job_description (dict): Structured job requirements
+        job_text (str): The formatted job description, see `format_job_description`
+        resume_texts (dict[str, str]): Formatted resumes keyed by resume id,
+                                       see `format_resume`
         cross_encoder_model: The cross-encoder model for pairwise scoring
         top_n (int): Number of top candidates to analyze in detail (default: 3)
         llm_weight (float): Weight for LLM score in final ranking (default: 0.7)
         cross_encoder_weight (float): Weight for cross-encoder score (default: 0.3)
+        cross_encoder_tag (str): Identifier of the cross-encoder, used as the score
+                                 cache namespace
+        batch_client (OpenAI | None): If given, the LLM judgments are submitted
+                                      through the OpenAI Batch API with this
+                                      client instead of concurrent requests
+        use_cache (bool): Whether to reuse cached LLM judgments and cross-encoder
+                          scores of the same inputs
+        hard_gate (bool): Whether to score candidates missing a must-have
+                          requirement without the LLM, see `prefilter.hard_gate`
 
     Returns:
         list[dict]: A list of dictionaries with candidate scores and analysis,
                    sorted in descending order by combined score
     """
-    top_candidates = bi_encoder_ranking[:top_n]
-    top_candidate_names = [c["candidate_name"] for c in top_candidates]
-
-    candidate_data_by_name = {
-        safe_get_nested(c, "contact_info", "name"): c for c in structured_resumes
-    }
-
-    job_text = format_job_description(structured_job_description)
-
-    llm_results = []
-    cross_encoder_scores = []
-
-    for name in top_candidate_names:
-        if name in candidate_data_by_name:
-            candidate_data = candidate_data_by_name[name]
-
-            # LLM Judge
-            llm_judgement = llm_as_a_judge(
-                client, structured_job_description, candidate_data
-            )
-            llm_results.append({"candidate_name": name, **llm_judgement})
-
-            # Cross-encoder
-            resume_text = format_resume(candidate_data)
-            raw_score = float(cross_encoder_model.predict([(job_text, resume_text)])[0])
-
-            # apply sigmoid to get a score between 0 and 1, then scale to 10
-            score = (1 / (1 + math.exp(-raw_score))) * 10.0
-            cross_encoder_scores.append(
-                {"candidate_name": name, "cross_encoder_score": score}
+    candidate_data_by_id = {c["_resume_id"]: c for c in structured_resumes}
+
+    # Skip candidates without structured data, and score each resume only once
+    top_candidates = [
+        c for c in bi_encoder_ranking[:top_n] if c["resume_id"] in candidate_data_by_id
+    ]
+    candidate_names = {c["resume_id"]: c["candidate_name"] for c in top_candidates}
+    scored_ids = list(candidate_names)
+    pairs = [(job_text, resume_texts[resume_id]) for resume_id in scored_ids]
+
+    # Cross-encoder: score all uncached pairs in one batched forward pass,
+    # off the event loop so it overlaps with the LLM requests
+    cross_encoder_task = asyncio.to_thread(
+        get_or_predict,
+        cross_encoder_model,
+        pairs,
+        cross_encoder_tag,
+        use_cache=use_cache,
+        batch_size=max(1, len(pairs)),
+        show_progress_bar=False,
+    )
+    # Candidates that provably miss a must-have are scored without the LLM
+    gated_judgements = {}
+    if hard_gate:
+        for resume_id in scored_ids:
+            judgement = apply_hard_gate(
+                structured_job_description, candidate_data_by_id[resume_id]
             )
+            if judgement is not None:
+                gated_judgements[resume_id] = judgement
+    judged_ids = [r for r in scored_ids if r not in gated_judgements]
+
+    # LLM Judge, serializing the job requirements once for all candidates
+    job_requirements_json = to_prompt_json(structured_job_description)
+    judged_resumes = [candidate_data_by_id[resume_id] for resume_id in judged_ids]
+    if batch_client is not None:
+        llm_task = asyncio.to_thread(
+            batch_judge,
+            batch_client,
+            job_requirements_json,
+            judged_resumes,
+            use_cache=use_cache,
+        )
+    else:
+        llm_task = judge_all(
+            client, job_requirements_json, judged_resumes, use_cache=use_cache
+        )
+    raw_scores, llm_judgements = await asyncio.gather(cross_encoder_task, llm_task)
+
+    llm_results_by_id = {
+        resume_id: {"candidate_name": candidate_names[resume_id], **llm_judgement}
+        for resume_id, llm_judgement in [
+            *zip(judged_ids, llm_judgements),
+            *gated_judgements.items(),
+        ]
+    }
+    # apply a numerically stable sigmoid to get a score between 0 and 1, then scale to 10
+    cross_encoder_scores = expit(np.asarray(raw_scores, dtype=np.float32)) * 10.0
+    cross_encoder_scores_by_id = dict(zip(scored_ids, cross_encoder_scores.tolist()))
 
     combined_results = []
-    for name in top_candidate_names:
-        llm_result = next((r for r in llm_results if r["candidate_name"] == name), {})
-        cross_result = next(
-            (s for s in cross_encoder_scores if s["candidate_name"] == name), {}
-        )
+    for resume_id in scored_ids:
+        llm_result = llm_results_by_id.get(resume_id, {})
 
         llm_score = llm_result.get("final_score", 0)
-        cross_score = cross_result.get("cross_encoder_score", 0)
+        cross_score = cross_encoder_scores_by_id.get(resume_id, 0)
 
         combined_score = (llm_score * llm_weight) + (cross_score * cross_encoder_weight)
 
         combined_results.append(
             {
-                "candidate_name": name,
+                "resume_id": resume_id,
+                "candidate_name": candidate_names[resume_id],
                 "llm_score": llm_score,
+                # The LLM score was set by `prefilter.hard_gate`, not the judge
+                "hard_gated": resume_id in gated_judgements,
                 "cross_encoder_score": cross_score,
                 "combined_score": combined_score,
                 "llm_analysis": llm_result,
@@ -0,0 +1,188 @@
+import hashlib
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from src.config import EMBED_CACHE_DIR
+
+
+def _content_hash(*parts: str) -> str:
+    """
+    Compute a SHA-256 content hash over one or more strings.
+
+    Args:
+        *parts: The strings to hash, e.g. a single text or a (query, document) pair
+
+    Returns:
+        str: The hex digest identifying the content
+    """
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_path(cache_dir: Path, model_tag: str, key: str) -> Path:
+    return Path(cache_dir) / model_tag.replace("/", "_") / key[:2] / f"{key}.npy"
+
+
+@lru_cache(maxsize=4096)
+def _load_cached(path: Path) -> np.ndarray:
+    """
+    Load a cached array from disk, memoizing it in memory.
+
+    Misses raise instead of returning a sentinel so that they aren't memoized.
+    The returned array is read-only since it is shared between callers.
+    """
+    array = np.load(path)
+    array.flags.writeable = False
+    return array
+
+
+def _save_atomic(path: Path, array: np.ndarray):
+    """
+    Save an array to disk so that readers never see a partially written file.
+
+    The array is written to a temporary file in the same directory and then
+    moved onto `path`, so an interrupted run leaves no truncated cache entry.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _get_or_compute(
+    keys, compute_missing, model_tag, cache_dir, use_cache: bool = True
+) -> list:
+    """
+    Look up cached arrays by key and compute the misses in a single call.
+
+    Args:
+        keys (list[str]): Content hashes identifying each input
+        compute_missing: Callable taking the indices of the missing inputs and
+                         returning one array per index, in the same order
+        model_tag (str): Identifier of the model (and settings) that produced the arrays
+        cache_dir (Path): Root directory of the on-disk cache
+        use_cache (bool): Whether to reuse cached arrays. If False, every input
+                          is recomputed and the cache is overwritten
+
+    Returns:
+        list[np.ndarray]: One array per key, in the same order as `keys`
+    """
+    results = [None] * len(keys)
+    if not use_cache:
+        missing = list(range(len(keys)))
+    else:
+        missing = []
+        for i, key in enumerate(keys):
+            path = _cache_path(cache_dir, model_tag, key)
+            try:
+                results[i] = _load_cached(path)
+            except FileNotFoundError:
+                missing.append(i)
+            except (OSError, ValueError, EOFError) as e:
+                logging.warning(f"Ignoring unreadable cache entry {path}: {e}")
+                missing.append(i)
+
+    if missing:
+        for i, array in zip(missing, compute_missing(missing)):
+            path = _cache_path(cache_dir, model_tag, keys[i])
+            _save_atomic(path, array)
+            results[i] = array
+        if not use_cache:
+            # Drop memoized copies of the arrays that were just overwritten
+            _load_cached.cache_clear()
+    return results
+
+
+def get_or_compute(
+    model,
+    texts: list[str],
+    model_tag: str,
+    cache_dir: Path = EMBED_CACHE_DIR,
+    use_cache: bool = True,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Encode texts with a bi-encoder, reusing embeddings cached on disk.
+
+    Each embedding is stored under `{cache_dir}/{model_tag}/{hash[:2]}/{hash}.npy`,
+    keyed by the SHA-256 of the text. Only texts without a cached embedding are
+    encoded, in a single batched `model.encode` call.
+
+    Args:
+        model: The SentenceTransformer model used to encode cache misses
+        texts (list[str]): The texts to encode
+        model_tag (str): Identifier of the model and encode settings, used to keep
+                         embeddings from different models apart
+        cache_dir (Path): Root directory of the on-disk cache
+        use_cache (bool): Whether to reuse cached embeddings. If False, every text
+                          is re-encoded and the cache is overwritten
+        **kwargs: Additional keyword arguments passed to `model.encode`
+
+    Returns:
+        np.ndarray: An array of shape (len(texts), embedding_dim)
+    """
+    if not texts:
+        return np.empty((0, model.get_sentence_embedding_dimension()), np.float32)
+
+    keys = [_content_hash(text) for text in texts]
+    embeddings = _get_or_compute(
+        keys,
+        lambda missing: model.encode(
+            [texts[i] for i in missing], convert_to_numpy=True, **kwargs
+        ),
+        model_tag,
+        cache_dir,
+        use_cache,
+    )
+    return np.stack(embeddings)
+
+
+def get_or_predict(
+    model,
+    pairs: list[tuple[str, str]],
+    model_tag: str,
+    cache_dir: Path = EMBED_CACHE_DIR,
+    use_cache: bool = True,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Score text pairs with a cross-encoder, reusing scores cached on disk.
+
+    Works like `get_or_compute`, but keys each raw score by the hash of the
+    (query, document) pair since cross-encoders attend over both texts jointly.
+
+    Args:
+        model: The CrossEncoder model used to score cache misses
+        pairs (list[tuple[str, str]]): The (query, document) pairs to score
+        model_tag (str): Identifier of the model, used to keep scores apart
+        cache_dir (Path): Root directory of the on-disk cache
+        use_cache (bool): Whether to reuse cached scores. If False, every pair is
+                          re-scored and the cache is overwritten
+        **kwargs: Additional keyword arguments passed to `model.predict`
+
+    Returns:
+        np.ndarray: An array of shape (len(pairs),) with the raw scores
+    """
+    if not pairs:
+        return np.empty((0,), np.float32)
+
+    keys = [_content_hash(query, document) for query, document in pairs]
+    scores = _get_or_compute(
+        keys,
+        lambda missing: model.predict(
+            [pairs[i] for i in missing], convert_to_numpy=True, **kwargs
+        ),
+        model_tag,
+        cache_dir,
+        use_cache,
+    )
+    return np.stack(scores)
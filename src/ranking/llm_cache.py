@@ -0,0 +1,63 @@
+import hashlib
+
+from src.config import JUDGE_CACHE_DIR, OPENAI_MODEL_NAME
+from src.ranking.prompts import JUDGE_PROMPT_VERSION
+from src.utils.helpers import public_fields
+from src.utils.json_cache import load_cached_json, save_cached_json
+from src.utils.json_io import dumps_json
+
+
+def judgment_cache_key(
+    job_requirements_json: str, resume_info: dict, model_name: str = OPENAI_MODEL_NAME
+) -> str:
+    """
+    Compute the cache key for an LLM judgment.
+
+    The key is a BLAKE2b hash of the canonical JSON of the serialized job
+    requirements, the resume, the model, and the judge prompt version, so
+    editing the prompt (and bumping `JUDGE_PROMPT_VERSION`) invalidates every
+    cached judgment. Internal fields such as `_resume_id` are left out, so
+    renaming a resume file keeps its cached judgment.
+
+    Args:
+        job_requirements_json (str): Serialized structured job requirements data
+        resume_info (dict): Structured resume data being evaluated
+        model_name (str): The OpenAI model performing the evaluation
+
+    Returns:
+        str: The hex digest identifying the judgment
+    """
+    payload = dumps_json(
+        {
+            "jd": job_requirements_json,
+            "r": public_fields(resume_info),
+            "m": model_name,
+            "p": JUDGE_PROMPT_VERSION,
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+def load_cached_judgment(key: str) -> dict | None:
+    """
+    Load a previously cached LLM judgment.
+
+    Args:
+        key (str): The cache key from `judgment_cache_key`
+
+    Returns:
+        dict | None: The cached judgment, or None on a cache miss
+    """
+    return load_cached_json(JUDGE_CACHE_DIR, key)
+
+
+def save_cached_judgment(key: str, judgment: dict):
+    """
+    Cache an LLM judgment on disk. Failed (empty) judgments are not cached.
+
+    Args:
+        key (str): The cache key from `judgment_cache_key`
+        judgment (dict): The judgment to cache
+    """
+    save_cached_json(JUDGE_CACHE_DIR, key, judgment)
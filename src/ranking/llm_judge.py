@@ -1,28 +1,101 @@
-import json
+import asyncio
 import logging
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
+from src.config import MAX_CONCURRENT_REQUESTS, OPENAI_MODEL_NAME
 from src.models.schema import LLMJudgment
-from src.ranking.prompts import judge_prompt_template
+from src.ranking.llm_cache import (
+    judgment_cache_key,
+    load_cached_judgment,
+    save_cached_judgment,
+)
+from src.ranking.prompts import (
+    judge_prompt_head,
+    judge_prompt_mid,
+    judge_prompt_tail,
+)
+from src.ranking.trim import trim_resume
+from src.utils.async_helpers import retry_with_backoff
+from src.utils.helpers import public_fields
+from src.utils.json_io import dumps_json
+from src.utils.openai_batch import strict_json_schema
 
+# Built once at import, rather than from LLMJudgment by the SDK on every request
+JUDGMENT_TEXT_FORMAT = {
+    "type": "json_schema",
+    "name": LLMJudgment.__name__,
+    "schema": strict_json_schema(LLMJudgment),
+    "strict": True,
+}
 
-def llm_as_a_judge(
-    client: OpenAI,
-    job_requirements: dict,
+
+def to_prompt_json(data: dict) -> str:
+    """
+    Serialize structured data for inclusion in the judge prompt.
+
+    The JSON is written compactly and without ASCII escaping since
+    whitespace and escape sequences only add input tokens.
+
+    Args:
+        data (dict): The structured job requirements or resume data
+
+    Returns:
+        str: The serialized JSON
+    """
+    return dumps_json(data)
+
+
+def build_judge_input(job_requirements_json: str, resume_info: dict) -> list[dict]:
+    """
+    Build the input messages asking the LLM to judge a resume.
+
+    Internal bookkeeping fields such as `_resume_id` are dropped, so the LLM
+    never sees file names, and long resume fields are trimmed to their budget,
+    see `trim_resume`.
+
+    Args:
+        job_requirements_json (str): Structured job requirements data, serialized
+                                     once per job with `to_prompt_json`
+        resume_info (dict): Structured resume data to evaluate
+
+    Returns:
+        list[dict]: The system and user messages for the Responses API
+    """
+    formatted_prompt = (
+        judge_prompt_head
+        + job_requirements_json
+        + judge_prompt_mid
+        + to_prompt_json(trim_resume(public_fields(resume_info)))
+        + judge_prompt_tail
+    )
+    return [
+        {"role": "system", "content": "You are a strict resume ranker."},
+        {"role": "user", "content": formatted_prompt},
+    ]
+
+
+async def llm_as_a_judge_async(
+    client: AsyncOpenAI,
+    job_requirements_json: str,
     resume_info: dict,
+    use_cache: bool = True,
 ) -> dict:
     """
     Use an LLM to evaluate how well a resume matches job requirements.
 
     This function formats job requirements and resume data for the LLM,
     then prompts it to perform a detailed analysis and provide scores
-    and insights according to the LLMJudgment schema.
+    and insights according to the LLMJudgment schema. The OpenAI API is
+    awaited so that several candidates can be judged concurrently, and
+    rate-limited requests are retried with exponential backoff.
 
     Args:
-        client (OpenAI): An initialized OpenAI client
-        job_requirements (dict): Structured job requirements data
+        client (AsyncOpenAI): An initialized async OpenAI client
+        job_requirements_json (str): Structured job requirements data, serialized
+                                     with `to_prompt_json`
         resume_info (dict): Structured resume data to evaluate
+        use_cache (bool): Whether to reuse a cached judgment of the same inputs
 
     Returns:
         dict: A dictionary containing detailed evaluation results conforming to
@@ -32,20 +105,57 @@ def llm_as_a_judge(
         The evaluation includes detailed analysis, pros/cons lists, a numerical score,
         and specific criteria matching assessments.
     """
-    formatted_prompt = judge_prompt_template.format(
-        job_requirements=json.dumps(job_requirements, indent=2),
-        resume_info=json.dumps(resume_info, indent=2),
-    )
+    cache_key = judgment_cache_key(job_requirements_json, resume_info)
+    if use_cache:
+        cached = load_cached_judgment(cache_key)
+        if cached is not None:
+            return cached
     try:
-        response = client.responses.parse(
-            model="gpt-4.1-nano",
-            input=[
-                {"role": "system", "content": "You are a strict resume ranker."},
-                {"role": "user", "content": formatted_prompt},
-            ],
-            text_format=LLMJudgment,
+        response = await retry_with_backoff(
+            client.responses.create,
+            model=OPENAI_MODEL_NAME,
+            input=build_judge_input(job_requirements_json, resume_info),
+            text={"format": JUDGMENT_TEXT_FORMAT},
         )
-        return json.loads(response.output_text)
+        result = LLMJudgment.model_validate_json(response.output_text).model_dump()
     except Exception as e:
         logging.error(f"LLM judgement failed: {e}")
         return {}
+    save_cached_judgment(cache_key, result)
+    return result
+
+
+async def judge_all(
+    client: AsyncOpenAI,
+    job_requirements_json: str,
+    resumes: list[dict],
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    use_cache: bool = True,
+) -> list[dict]:
+    """
+    Evaluate several resumes against the same job requirements concurrently.
+
+    All judgments are issued at once with `asyncio.gather`, with a semaphore
+    bounding the number of in-flight requests to stay within rate limits.
+
+    Args:
+        client (AsyncOpenAI): An initialized async OpenAI client
+        job_requirements_json (str): Structured job requirements data, serialized
+                                     with `to_prompt_json`
+        resumes (list[dict]): Structured resume data to evaluate
+        max_concurrency (int): Maximum number of concurrent requests
+        use_cache (bool): Whether to reuse cached judgments of the same inputs
+
+    Returns:
+        list[dict]: One evaluation result per resume, in the same order as the
+                    input. Failed evaluations are returned as empty dicts.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def judge(resume_info: dict) -> dict:
+        async with semaphore:
+            return await llm_as_a_judge_async(
+                client, job_requirements_json, resume_info, use_cache=use_cache
+            )
+
+    return await asyncio.gather(*[judge(resume) for resume in resumes])
@@ -0,0 +1,196 @@
+import re
+
+from src.utils.helpers import public_fields
+
+# The judge prompt caps candidates missing a must-have requirement at this score
+MISSING_MUST_HAVE_MAX_SCORE = 6
+
+# Words that qualify a must-have phrase rather than name the skill itself, e.g.
+# "Strong communication skills" or "Experience with REST APIs"
+FILLER_WORDS = frozenset(
+    """
+    a an and the of in with for to on using ability advanced deep demonstrated
+    excellent experience experienced expertise familiar familiarity good
+    hands-on knowledge plus proficiency proficient proven skill skills solid
+    strong understanding working year years
+    """.split()
+)
+
+
+def _resume_values(value):
+    """
+    Yield every string value of structured resume data, skipping field names.
+
+    Args:
+        value: The structured resume data, or any value nested in it
+
+    Yields:
+        str: The string values, in document order
+    """
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for nested in value.values():
+            yield from _resume_values(nested)
+    elif isinstance(value, list):
+        for nested in value:
+            yield from _resume_values(nested)
+
+
+def mentions_requirement(requirement: str, text: str) -> bool:
+    """
+    Check whether a skill or tool is mentioned in a text as a whole word.
+
+    The match is case-insensitive and must not be part of a longer word, so
+    "Java" is not found in "JavaScript", "Go" is not found in "Google" and "C"
+    is not found in "C++" or "C#".
+
+    Args:
+        requirement (str): The skill or tool, e.g. "Python" or "C++"
+        text (str): The text to search
+
+    Returns:
+        bool: Whether the requirement appears in the text
+    """
+    pattern = rf"(?<!\w){re.escape(requirement.strip())}(?![\w+#])"
+    return re.search(pattern, text, re.IGNORECASE) is not None
+
+
+def _significant_tokens(requirement: str) -> list[str]:
+    """
+    Split a must-have phrase into the words that name the skill.
+
+    Filler words (see FILLER_WORDS) and tokens without letters, such as "5+",
+    are dropped, e.g. "Experience with REST APIs" gives ["REST", "APIs"].
+
+    Args:
+        requirement (str): The must-have phrase
+
+    Returns:
+        list[str]: The significant tokens, in order
+    """
+    tokens = (token.strip(",;:()") for token in requirement.split())
+    return [
+        token
+        for token in tokens
+        if token.lower() not in FILLER_WORDS and any(c.isalpha() for c in token)
+    ]
+
+
+def _alternatives(requirement: str) -> list[str]:
+    """
+    Split a must-have into the alternatives that each satisfy it.
+
+    Alternatives are separated by "/", "or" or parentheses, e.g.
+    "Kubernetes (K8s)" gives ["Kubernetes", "K8s"] and "AWS/GCP" gives
+    ["AWS", "GCP"].
+
+    Args:
+        requirement (str): The must-have phrase
+
+    Returns:
+        list[str]: The non-empty alternatives, in order
+    """
+    parts = re.split(r"[/()]|\bor\b", requirement, flags=re.IGNORECASE)
+    return [part.strip() for part in parts if part.strip()]
+
+
+def meets_requirement(requirement: str, text: str) -> bool:
+    """
+    Check whether a text covers a must-have skill or tool.
+
+    The requirement is met if it is mentioned as a whole, see
+    `mentions_requirement`, or if any of its alternatives (see
+    `_alternatives`) is. An alternative whose only significant token is
+    mentioned, in singular or plural form, counts as mentioned, so "Strong
+    communication skills" matches "communication". Alternatives with several
+    significant tokens ("CI/CD pipelines", "Experience with REST APIs") or
+    none ("Strong skills") can't be checked reliably and always count as met,
+    leaving them to the LLM judge.
+
+    Args:
+        requirement (str): The must-have phrase, e.g. "Python" or
+                           "Strong communication skills"
+        text (str): The text to search
+
+    Returns:
+        bool: Whether the requirement is met by the text
+    """
+    if mentions_requirement(requirement, text):
+        return True
+    for alternative in _alternatives(requirement):
+        tokens = _significant_tokens(alternative)
+        if len(tokens) != 1:
+            return True
+        (token,) = tokens
+        if (
+            mentions_requirement(token, text)
+            or mentions_requirement(f"{token}s", text)
+            or (token[-1:].lower() == "s" and mentions_requirement(token[:-1], text))
+        ):
+            return True
+    return False
+
+
+def hard_gate(job_requirements: dict, resume_info: dict) -> dict | None:
+    """
+    Score a resume without the LLM if it misses a must-have requirement.
+
+    A requirement from `must_have_skills` or `must_have_tools` counts as met if
+    any value of the structured resume covers it, see `meets_requirement`.
+    Field names and internal fields such as
+    `_resume_id` are not searched. Searching every value rather than only the
+    skills lists keeps the gate conservative, so a candidate is only gated
+    when the requirement is absent altogether.
+
+    `required_education` is not gated: degrees are free text ("BSc Computer
+    Science" vs "Bachelor's in CS") that can't be matched reliably, so it is
+    left to the LLM judge.
+
+    Args:
+        job_requirements (dict): Structured job requirements data
+        resume_info (dict): Structured resume data to evaluate
+
+    Returns:
+        dict | None: A judgment conforming to the LLMJudgment schema, scored in
+                     proportion to the must-haves met and capped at
+                     MISSING_MUST_HAVE_MAX_SCORE, or None if every must-have is
+                     met and the resume should be judged by the LLM
+    """
+    hard_requirements = job_requirements.get("hard_requirements") or {}
+    must_haves = list(
+        dict.fromkeys(
+            req
+            for req in (hard_requirements.get("must_have_skills") or [])
+            + (hard_requirements.get("must_have_tools") or [])
+            if req.strip()
+        )
+    )
+    resume_text = "\n".join(_resume_values(public_fields(resume_info)))
+    is_met = {req: meets_requirement(req, resume_text) for req in must_haves}
+    met = [req for req in must_haves if is_met[req]]
+    missing = [req for req in must_haves if not is_met[req]]
+    if not missing:
+        return None
+
+    return {
+        "detailed_analysis": (
+            "Scored without LLM evaluation because the resume is missing "
+            f"must-have requirements: {', '.join(missing)}."
+        ),
+        "pros": [f"Has must-have requirement: {req}" for req in met],
+        "cons": [f"Missing must-have requirement: {req}" for req in missing],
+        "final_score": MISSING_MUST_HAVE_MAX_SCORE * len(met) / len(must_haves),
+        "match_criteria": [
+            {
+                "criterion": req,
+                "is_match": is_met[req],
+                "comment": (
+                    "Found in the resume."
+                    if is_met[req]
+                    else "Not found in the resume."
+                ),
+            }
+            for req in must_haves
+        ],
+    }
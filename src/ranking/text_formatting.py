@@ -1,5 +1,12 @@
 from src.ranking.prompts import job_signal_text, resume_signal_text
-from src.utils.helpers import safe_get_nested, safe_join
+from src.utils.helpers import safe_join
+
+# Skill lists of the resume, in the order they are written out
+SKILL_SECTIONS = (
+    "programming_languages",
+    "frameworks_and_libraries",
+    "platforms_and_tools",
+)
 
 
 def format_job_description(structured_job_description: dict) -> str:
@@ -16,41 +23,25 @@ def format_job_description(structured_job_description: dict) -> str:
     Returns:
         str: A formatted text representation of the job description
     """
-    job_context = safe_get_nested(structured_job_description, "job_context", default={})
-    role_description = safe_get_nested(
-        structured_job_description, "role_description", default={}
-    )
-    hard_requirements = safe_get_nested(
-        structured_job_description, "hard_requirements", default={}
-    )
-    preferred_quals = safe_get_nested(
-        structured_job_description, "preferred_qualifications", default={}
-    )
+    # The structure follows the extraction schema, so fields are read directly;
+    # `or` keeps the defaults for keys that are present but null or empty
+    job_context = structured_job_description.get("job_context") or {}
+    role_description = structured_job_description.get("role_description") or {}
+    hard_requirements = structured_job_description.get("hard_requirements") or {}
+    preferred_quals = structured_job_description.get("preferred_qualifications") or {}
 
     return job_signal_text.format(
-        job_title=safe_get_nested(job_context, "job_title", default=""),
-        seniority=safe_get_nested(job_context, "seniority_level", default=""),
-        key_responsibilities=safe_join(
-            safe_get_nested(role_description, "key_responsibilities", default=[])
-        ),
-        required_skills=safe_join(
-            safe_get_nested(hard_requirements, "must_have_skills", default=[])
-        ),
-        required_tools=safe_join(
-            safe_get_nested(hard_requirements, "must_have_tools", default=[])
-        ),
-        preferred_skills=safe_join(
-            safe_get_nested(preferred_quals, "preferred_skills", default=[])
-        ),
-        preferred_tools=safe_join(
-            safe_get_nested(preferred_quals, "preferred_tools", default=[])
-        ),
+        job_title=job_context.get("job_title") or "",
+        seniority=job_context.get("seniority_level") or "",
+        key_responsibilities=safe_join(role_description.get("key_responsibilities")),
+        required_skills=safe_join(hard_requirements.get("must_have_skills")),
+        required_tools=safe_join(hard_requirements.get("must_have_tools")),
+        preferred_skills=safe_join(preferred_quals.get("preferred_skills")),
+        preferred_tools=safe_join(preferred_quals.get("preferred_tools")),
         required_experience=safe_join(
-            safe_get_nested(hard_requirements, "required_experience_type", default=[])
-        ),
-        domain_knowledge=safe_join(
-            safe_get_nested(role_description, "domain_knowledge", default=[])
+            hard_requirements.get("required_experience_type")
         ),
+        domain_knowledge=safe_join(role_description.get("domain_knowledge")),
     )
 
 
@@ -68,36 +59,28 @@ def format_resume(candidate_data: dict) -> str:
     Returns:
         str: A formatted text representation of the resume
     """
-    skills_section = safe_get_nested(candidate_data, "skills_section", default={})
-    all_skills = (
-        safe_get_nested(skills_section, "programming_languages", default=[])
-        + safe_get_nested(skills_section, "frameworks_and_libraries", default=[])
-        + safe_get_nested(skills_section, "platforms_and_tools", default=[])
+    # Each field is joined straight from a generator over the structured data,
+    # without building intermediate lists
+    skills_section = candidate_data.get("skills_section") or {}
+    skills = " ".join(
+        skill
+        for section in SKILL_SECTIONS
+        for skill in skills_section.get(section) or ()
+    )
+    job_roles = " ".join(
+        f"{job.get('job_title') or ''} at {job.get('company') or ''}: "
+        f"{' '.join(job.get('achievements') or ())}"
+        for job in candidate_data.get("work_experience") or ()
+    )
+    projects = " ".join(
+        f"{proj.get('project_name') or ''}: {proj.get('description') or ''}"
+        for proj in candidate_data.get("projects") or ()
     )
-
-    work_experience = safe_get_nested(candidate_data, "work_experience", default=[])
-    job_roles = []
-    for job in work_experience:
-        company = safe_get_nested(job, "company", default="")
-        role = safe_get_nested(job, "job_title", default="")
-        achievements = safe_get_nested(job, "achievements", default=[])
-        job_roles.append(f"{role} at {company}: {' '.join(achievements)}")
-
-    projects = safe_get_nested(candidate_data, "projects", default=[])
-    project_texts = []
-    for proj in projects:
-        name = safe_get_nested(proj, "project_name", default="")
-        desc = safe_get_nested(proj, "description", default="")
-        project_texts.append(f"{name}: {desc}")
 
     return resume_signal_text.format(
-        professional_summary=safe_get_nested(
-            candidate_data, "professional_summary", default=""
-        ),
-        skills=safe_join(all_skills),
-        job_roles_and_achivements=safe_join(job_roles),
-        projects=safe_join(project_texts),
-        certificates=safe_join(
-            safe_get_nested(candidate_data, "certifications", default=[])
-        ),
+        professional_summary=candidate_data.get("professional_summary") or "",
+        skills=skills,
+        job_roles_and_achivements=job_roles,
+        projects=projects,
+        certificates=safe_join(candidate_data.get("certifications")),
     )
@@ -0,0 +1,89 @@
+from src.config import JUDGE_FIELD_CHAR_LIMITS
+
+ELLIPSIS = "..."
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """
+    Truncate a string to at most `max_chars` characters at a word boundary.
+
+    Leading and trailing whitespace is stripped first, so it neither uses up
+    the budget nor counts as a word boundary.
+
+    Args:
+        text (str): The text to truncate
+        max_chars (int): The maximum number of characters to keep
+
+    Returns:
+        str: The text unchanged if it fits, otherwise its longest prefix of
+             whole words followed by an ellipsis. A budget with no room for
+             the ellipsis keeps a bare prefix of the text instead.
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return text
+    if max_chars <= len(ELLIPSIS):
+        return text[: max(max_chars, 0)]
+    cut = text[: max(max_chars - len(ELLIPSIS), 0)]
+    space = cut.rfind(" ")
+    if space > 0:
+        cut = cut[:space]
+    return cut.rstrip() + ELLIPSIS
+
+
+def _trim_value(value, max_chars: int):
+    """
+    Fit a string, or a list of strings, into a character budget.
+
+    Items of a list share the budget: they are kept in order until it is
+    spent, truncating the last item that only partly fits. Items are dropped
+    once too little budget is left for more than an ellipsis.
+
+    Args:
+        value: The field value, a string or a list of strings
+        max_chars (int): The character budget of the field
+
+    Returns:
+        The trimmed value, or `value` unchanged if it is of another type
+    """
+    if isinstance(value, str):
+        return _truncate(value, max_chars)
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        trimmed = []
+        remaining = max_chars
+        for item in value:
+            if remaining <= len(ELLIPSIS):
+                break
+            trimmed.append(_truncate(item, remaining))
+            remaining -= len(item)
+        return trimmed
+    return value
+
+
+def trim_resume(resume, max_chars_per_field: dict = JUDGE_FIELD_CHAR_LIMITS):
+    """
+    Cap the length of long free-text fields of a structured resume.
+
+    The resume is walked recursively and every field named in
+    `max_chars_per_field` is trimmed to its character budget, so that a long
+    work history does not inflate the judge prompt. The input is not modified.
+
+    Args:
+        resume: The structured resume data, or any value nested in it
+        max_chars_per_field (dict): Character budget per field name
+
+    Returns:
+        A trimmed copy of the resume
+    """
+    if isinstance(resume, dict):
+        return {
+            key: (
+                _trim_value(value, max_chars_per_field[key])
+                if key in max_chars_per_field
+                else trim_resume(value, max_chars_per_field)
+            )
+            for key, value in resume.items()
+        }
+    if isinstance(resume, list):
+        return [trim_resume(item, max_chars_per_field) for item in resume]
+    return resume
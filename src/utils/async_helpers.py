@@ -0,0 +1,38 @@
+import asyncio
+import logging
+import random
+
+from openai import RateLimitError
+
+
+async def retry_with_backoff(
+    func, *args, max_retries: int = 5, base_delay: float = 1.0, **kwargs
+):
+    """
+    Await an async callable, retrying with exponential backoff on rate limits.
+
+    The delay doubles after every `RateLimitError` and has random jitter added
+    so that concurrent requests don't retry in lockstep.
+
+    Args:
+        func: The async callable to await
+        *args: Positional arguments passed to `func`
+        max_retries (int): Maximum number of retries before giving up (default: 5)
+        base_delay (float): Delay in seconds before the first retry (default: 1.0)
+        **kwargs: Keyword arguments passed to `func`
+
+    Returns:
+        The result of `func`
+
+    Raises:
+        RateLimitError: If the request is still rate limited after `max_retries` retries
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await func(*args, **kwargs)
+        except RateLimitError:
+            if attempt == max_retries:
+                raise
+            delay = base_delay * (2**attempt) * (1 + random.random())
+            logging.warning(f"Rate limited, retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
@@ -4,7 +4,8 @@ def safe_get_nested(dictionary, *keys, default=None):
 
     This utility function allows accessing deeply nested keys in dictionaries
     without having to check for each level's existence. If any key in the
-    path doesn't exist, the default value is returned.
+    path doesn't exist or holds None, the default value is returned. Other
+    falsy values such as 0, "" or [] are returned as they are.
 
     Args:
         dictionary (dict): The dictionary to access
@@ -24,7 +25,7 @@ def safe_get_nested(dictionary, *keys, default=None):
         if not isinstance(current, dict) or key not in current:
             return default
         current = current[key]
-    return current or default
+    return current if current is not None else default
 
 
 def safe_join(items, default=None):
@@ -32,11 +33,13 @@ def safe_join(items, default=None):
     Safely join a list of items into a space-separated string.
 
     This function handles None values and empty lists by returning
-    a default value. Each item is converted to a string before joining.
+    a default value. Items that are not strings are converted to strings
+    before joining.
 
     Args:
-        items (list): The items to join
-        default: Value to use if items is None (default: None, which becomes [])
+        items (Iterable): The items to join
+        default: Value to use if items is None or empty (default: None, which
+                 becomes [])
 
     Returns:
         str: A space-separated string of the items
@@ -46,5 +49,36 @@ def safe_join(items, default=None):
         safe_join(None)  # Returns ''
         safe_join([], default=['N/A'])  # Returns 'N/A'
     """
-    items = items or default or []
-    return " ".join(map(str, items))
+    if items is None:
+        items = ()
+    elif not isinstance(items, (list, tuple)):
+        # Materialize iterators so the fallback below can iterate them again
+        items = list(items)
+    if not items:
+        # Both None and an empty sequence fall back to the default
+        items = default if default is not None else ()
+    try:
+        # Fast path for the common case of a list of strings
+        return " ".join(items)
+    except TypeError:
+        return " ".join(map(str, items))
+
+
+def public_fields(data: dict) -> dict:
+    """
+    Drop the internal bookkeeping fields of a structured record.
+
+    Fields whose names start with an underscore, such as `_resume_id`, are
+    added by the pipeline rather than extracted from the source document, so
+    they are kept out of LLM prompts and content-hash cache keys.
+
+    Args:
+        data (dict): The structured record
+
+    Returns:
+        dict: A shallow copy of `data` without underscore-prefixed keys
+
+    Example:
+        public_fields({'name': 'Jane', '_resume_id': 'jane'})  # Returns {'name': 'Jane'}
+    """
+    return {key: value for key, value in data.items() if not key.startswith("_")}
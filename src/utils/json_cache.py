@@ -0,0 +1,43 @@
+import logging
+from pathlib import Path
+
+from src.utils.json_io import read_json, write_json
+
+
+def load_cached_json(cache_dir: Path, key: str) -> dict | None:
+    """
+    Load a JSON result cached under a content-hash key.
+
+    Args:
+        cache_dir (Path): Directory holding the cache entries
+        key (str): The content hash identifying the entry
+
+    Returns:
+        dict | None: The cached result, or None on a cache miss
+    """
+    path = Path(cache_dir) / f"{key}.json"
+    if not path.exists():
+        return None
+    try:
+        return read_json(path)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+
+def save_cached_json(cache_dir: Path, key: str, result: dict):
+    """
+    Cache a JSON result on disk under a content-hash key.
+
+    Empty results come from failed API calls and are not cached, so they are
+    retried on the next run.
+
+    Args:
+        cache_dir (Path): Directory holding the cache entries
+        key (str): The content hash identifying the entry
+        result (dict): The result to cache
+    """
+    if not result:
+        return
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    write_json(Path(cache_dir) / f"{key}.json", result, indent=False)
@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj, sort_keys: bool = False) -> str:
+    """
+    Serialize an object to a compact JSON string.
+
+    Non-ASCII characters are written as-is, matching orjson's output when the
+    standard library fallback is used.
+
+    Args:
+        obj: The JSON-serializable object to serialize
+        sort_keys (bool): Whether to sort dictionary keys (default: False)
+
+    Returns:
+        str: The serialized JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys
+    )
+
+
+def loads_json(data: str | bytes):
+    """
+    Deserialize a JSON string.
+
+    Args:
+        data (str | bytes): The JSON document
+
+    Returns:
+        The deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: Path, obj, indent: bool = True):
+    """
+    Serialize an object to a JSON file.
+
+    Uses orjson (a C extension) when it is installed, falling back to the
+    standard library otherwise.
+
+    Args:
+        path (Path): The file to write
+        obj: The JSON-serializable object to write
+        indent (bool): Whether to pretty-print with two-space indentation (default: True)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        Path(path).write_bytes(orjson.dumps(obj, option=option))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+
+def read_json(path: Path):
+    """
+    Deserialize a JSON file.
+
+    Args:
+        path (Path): The file to read
+
+    Returns:
+        The deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
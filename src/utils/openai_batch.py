@@ -0,0 +1,89 @@
+import io
+import logging
+import time
+
+from openai import OpenAI, pydantic_function_tool
+
+from src.config import BATCH_POLL_INTERVAL_SECONDS
+from src.utils.json_io import dumps_json, loads_json
+
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def strict_json_schema(model_class) -> dict:
+    """
+    Build the strict JSON schema the OpenAI API expects for structured outputs.
+
+    Uses the public `openai.pydantic_function_tool` helper, which applies the
+    same rules as `client.responses.parse(text_format=...)`: objects are
+    closed, all properties are required, `None` defaults are dropped, and
+    `$ref`s with sibling keywords are inlined. This is needed when building
+    raw request bodies, e.g. for the Batch API.
+
+    Args:
+        model_class: The Pydantic model describing the expected output
+
+    Returns:
+        dict: The strict JSON schema for the model
+    """
+    return pydantic_function_tool(model_class)["function"]["parameters"]
+
+
+def run_batch(
+    client: OpenAI,
+    requests: list[dict],
+    endpoint: str,
+    poll_interval: float = BATCH_POLL_INTERVAL_SECONDS,
+) -> dict[str, dict]:
+    """
+    Submit requests through the OpenAI Batch API and wait for the results.
+
+    The requests are uploaded as a JSONL file, submitted as a single batch with a
+    24h completion window, and polled until the batch reaches a terminal status.
+
+    Args:
+        client (OpenAI): An initialized OpenAI client instance
+        requests (list[dict]): Batch request lines, each with a unique `custom_id`
+        endpoint (str): The API endpoint the requests target (e.g. "/v1/chat/completions")
+        poll_interval (float): Seconds to wait between status checks
+
+    Returns:
+        dict[str, dict]: A mapping of `custom_id` to the response body of each
+                         successful request
+
+    Note:
+        Failed requests are logged and left out of the returned mapping. If the
+        batch itself doesn't complete, an empty dict is returned.
+    """
+    jsonl = "\n".join(dumps_json(request) for request in requests)
+    input_file = client.files.create(
+        file=("batch_input.jsonl", io.BytesIO(jsonl.encode("utf-8"))),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id, endpoint=endpoint, completion_window="24h"
+    )
+    logging.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        logging.info(f"Batch {batch.id} status: {batch.status}")
+
+    if batch.status != "completed" or not batch.output_file_id:
+        logging.error(f"Batch {batch.id} did not complete: {batch.status}")
+        return {}
+
+    results = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        result = loads_json(line)
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            logging.error(
+                f"Batch request {result.get('custom_id')} failed: {result.get('error')}"
+            )
+            continue
+        results[result["custom_id"]] = response["body"]
+    return results
@@ -1,15 +1,25 @@
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Callable, Dict
 import docx2txt
 from PyPDF2 import PdfReader
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 
 def extract_text_from_pdf(resume_path: Path) -> str:
     """
     Extract plain text content from a PDF file.
 
     This function reads each page of the PDF and concatenates the extracted text.
+    Uses pypdfium2 (bindings to the C++ PDFium library) when it is installed,
+    falling back to the pure-Python PyPDF2 otherwise.
 
     Args:
         resume_path (Path): Path to the PDF file
@@ -18,8 +28,14 @@ def extract_text_from_pdf(resume_path: Path) -> str:
         str: The extracted text content
 
     Raises:
-        Any exceptions from PyPDF2 during PDF processing
+        Any exceptions from pypdfium2 or PyPDF2 during PDF processing
     """
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(str(resume_path))
+        try:
+            return "".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
     with resume_path.open("rb") as f:
         pdf_reader = PdfReader(f)
         return "".join(page.extract_text() for page in pdf_reader.pages)
@@ -45,6 +61,9 @@ def extract_text_from_txt(resume_path) -> str:
     """
     Extract plain text content from a text file.
 
+    The file is read in a single call and decoded as UTF-8, replacing invalid
+    bytes, rather than relying on the platform's default text encoding.
+
     Args:
         resume_path (Path): Path to the text file
 
@@ -54,8 +73,7 @@ def extract_text_from_txt(resume_path) -> str:
     Raises:
         Any exceptions during file opening/reading
     """
-    with open(resume_path, "r") as file:
-        return file.read()
+    return Path(resume_path).read_bytes().decode("utf-8", errors="replace")
 
 
 SUPPORTED_EXTENSIONS: Dict[str, Callable] = {
@@ -66,35 +84,103 @@ SUPPORTED_EXTENSIONS: Dict[str, Callable] = {
 }
 
 
-def load_raw_resume_texts(resume_folder: Path) -> dict[str, str]:
+def _split_file_name(name: str) -> tuple[str, str]:
+    """
+    Split a file name into its stem and lower-cased extension.
+
+    Equivalent to `Path.stem` and `Path.suffix.lower()`, without building a Path.
+
+    Args:
+        name (str): The file name
+
+    Returns:
+        tuple[str, str]: The stem and the extension including the dot, or an
+                         empty extension if the name has none
+    """
+    dot = name.rfind(".")
+    if dot <= 0:
+        return name, ""
+    return name[:dot], name[dot:].lower()
+
+
+def _extract_one(resume_file: Path, suffix: str) -> str:
+    """
+    Extract the text of a single resume file, dispatching on its extension.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Args:
+        resume_file (Path): Path to a resume file
+        suffix (str): The lower-cased extension of the file, one of
+                      SUPPORTED_EXTENSIONS
+
+    Returns:
+        str: The extracted text content
+    """
+    return SUPPORTED_EXTENSIONS[suffix](resume_file)
+
+
+def load_raw_resume_texts(resume_folder: Path) -> dict[str, tuple[Path, str]]:
     """
     Load text content from all supported resume files in a directory.
 
     This function scans the specified folder for resume files with supported
     extensions (.pdf, .docx, .txt, .text) and extracts their text content.
+    Parsing is CPU-bound, so files are extracted in parallel worker processes,
+    at most one per file and CPU. A single file is extracted in this process.
 
     Args:
         resume_folder (Path): Path to the folder containing resume files
 
     Returns:
-        dict[str, str]: A dictionary mapping file names (without extensions)
-                         to their extracted text content
+        dict[str, tuple[Path, str]]: A dictionary mapping resume ids (file names
+                         without extensions, or full file names for files
+                         sharing a stem) to the file path and its extracted
+                         text content, in directory listing order
 
     Note:
         If an error occurs during text extraction for a specific file,
-        the error is printed to stdout and the file is skipped.
+        the error is logged and the file is skipped.
     """
     texts = {}
-    resume_files = list(resume_folder.iterdir())
     logging.info(f"Loading resumes from {resume_folder}")
-    for resume_file in resume_files:
-        if resume_file.is_file():
-            file_suffix = resume_file.suffix.lower()
-            if file_suffix in SUPPORTED_EXTENSIONS:
-                try:
-                    extractor = SUPPORTED_EXTENSIONS[file_suffix]
-                    file_content = extractor(resume_file)
-                    texts[resume_file.stem] = file_content
-                except Exception as e:
-                    logging.error(f"Error processing {resume_file.name}: {str(e)}")
+    # Filter on the extension before the (cached) file type check
+    resume_files = []
+    with os.scandir(resume_folder) as entries:
+        for entry in entries:
+            stem, suffix = _split_file_name(entry.name)
+            if suffix in SUPPORTED_EXTENSIONS and entry.is_file():
+                resume_files.append((stem, suffix, Path(entry.path)))
+    # Ids are file stems unless several files share one (e.g. jane.pdf and
+    # jane.docx), in which case those files are keyed by their full name
+    stem_counts = Counter(stem for stem, _, _ in resume_files)
+    for stem, count in stem_counts.items():
+        if count > 1:
+            logging.warning(
+                f"{count} resume files are named {stem!r}, keying them by file name"
+            )
+    resume_files = [
+        (stem if stem_counts[stem] == 1 else resume_file.name, suffix, resume_file)
+        for stem, suffix, resume_file in resume_files
+    ]
+    # Worker processes re-import the pipeline on spawn platforms, which costs
+    # more than extracting a single file in this process
+    max_workers = min(len(resume_files), os.cpu_count() or 1)
+    if max_workers <= 1:
+        for stem, suffix, resume_file in resume_files:
+            try:
+                texts[stem] = (resume_file, _extract_one(resume_file, suffix))
+            except Exception as e:
+                logging.error(f"Error processing {resume_file.name}: {str(e)}")
+        return texts
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (stem, resume_file, executor.submit(_extract_one, resume_file, suffix))
+            for stem, suffix, resume_file in resume_files
+        ]
+        for stem, resume_file, future in futures:
+            try:
+                texts[stem] = (resume_file, future.result())
+            except Exception as e:
+                logging.error(f"Error processing {resume_file.name}: {str(e)}")
     return texts
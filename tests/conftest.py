@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+
+class StubEncoder:
+    """Maps each known text to a fixed unit vector and counts encoded texts."""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.encoded = 0
+
+    def encode(self, texts, convert_to_numpy=True, **kwargs):
+        self.encoded += len(texts)
+        return np.array([self.vectors[text] for text in texts], dtype=np.float32)
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+
+@pytest.fixture
+def stub_encoder():
+    """Build a StubEncoder from a mapping of texts to their embeddings."""
+    return StubEncoder
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from src.extraction.batch_extract import _parse_response as parse_extraction
+from src.ranking.batch_judge import _parse_response as parse_judgment
+
+JUDGMENT = {
+    "detailed_analysis": "Strong match.",
+    "pros": ["Python"],
+    "cons": [],
+    "final_score": 8.5,
+    "match_criteria": [{"criterion": "Python", "is_match": True, "comment": "Used"}],
+}
+
+
+class Skill(BaseModel):
+    name: str
+    years: int
+
+
+def _chat_body(content):
+    return {"choices": [{"message": {"content": content}}]}
+
+
+def _responses_body(*texts):
+    return {
+        "output": [
+            {"type": "reasoning", "summary": []},
+            {
+                "type": "message",
+                "content": [{"type": "output_text", "text": text} for text in texts],
+            },
+        ]
+    }
+
+
+# (parse, build_body, valid output, output not matching the schema)
+PARSERS = [
+    pytest.param(
+        parse_judgment,
+        _responses_body,
+        JUDGMENT,
+        {**JUDGMENT, "final_score": 42},
+        id="judgment",
+    ),
+    pytest.param(
+        lambda custom_id, body: parse_extraction(custom_id, body, Skill),
+        _chat_body,
+        {"name": "Python", "years": 5},
+        {"name": "Python"},
+        id="extraction",
+    ),
+]
+
+
+@pytest.mark.parametrize("parse, build_body, valid, invalid", PARSERS)
+def test_parse_response_validates_against_schema(parse, build_body, valid, invalid):
+    assert parse("request_0", build_body(json.dumps(valid))) == valid
+
+
+@pytest.mark.parametrize("parse, build_body, valid, invalid", PARSERS)
+def test_parse_response_rejects_output_not_matching_schema(
+    parse, build_body, valid, invalid
+):
+    assert parse("request_0", build_body(json.dumps(invalid))) == {}
+
+
+@pytest.mark.parametrize("parse, build_body, valid, invalid", PARSERS)
+def test_parse_response_returns_empty_dict_for_failed_request(
+    parse, build_body, valid, invalid
+):
+    assert parse("request_0", None) == {}
+
+
+def test_parse_judgment_joins_output_text():
+    text = json.dumps(JUDGMENT)
+    body = _responses_body(text[:10], text[10:])
+    assert parse_judgment("judgment_0", body) == JUDGMENT
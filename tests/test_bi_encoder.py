@@ -0,0 +1,41 @@
+import functools
+
+import numpy as np
+
+from src.ranking.bi_encoder import bi_encoder_resume_filtering
+from src.ranking.embed_cache import get_or_compute
+
+
+def test_bi_encoder_resume_filtering_orders_by_similarity(
+    tmp_path, monkeypatch, stub_encoder
+):
+    monkeypatch.setattr(
+        "src.ranking.bi_encoder.get_or_compute",
+        functools.partial(get_or_compute, cache_dir=tmp_path),
+    )
+    model = stub_encoder(
+        {
+            "job": [1.0, 0.0],
+            "far": [0.0, 1.0],
+            "close": [0.8, 0.6],
+            "same": [1.0, 0.0],
+            "tie": [1.0, 0.0],
+        }
+    )
+    resume_texts = {"r1": "far", "r2": "close", "r3": "same", "r4": "tie"}
+    names = {resume_id: f"Candidate {resume_id}" for resume_id in resume_texts}
+
+    ranking = bi_encoder_resume_filtering(
+        "job",
+        resume_texts,
+        names,
+        model,
+        model_tag="stub",
+        job_embedding=np.array([1.0, 0.0], np.float32),
+        use_cache=False,
+    )
+
+    # ties keep their input order
+    assert [r["resume_id"] for r in ranking] == ["r3", "r4", "r2", "r1"]
+    assert ranking[0]["candidate_name"] == "Candidate r3"
+    assert ranking[2]["rank"] == np.float32(0.8)
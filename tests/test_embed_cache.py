@@ -0,0 +1,47 @@
+import numpy as np
+
+from src.ranking.embed_cache import _cache_path, _content_hash, get_or_compute
+
+
+def test_content_hash_is_stable_and_separates_pairs():
+    assert _content_hash("a") == _content_hash("a")
+    assert _content_hash("a") != _content_hash("b")
+    assert _content_hash("ab", "c") != _content_hash("a", "bc")
+
+
+def test_cache_path_is_sharded_by_tag_and_key(tmp_path):
+    key = _content_hash("text")
+    path = _cache_path(tmp_path, "org/model", key)
+    assert path == tmp_path / "org_model" / key[:2] / f"{key}.npy"
+
+
+def test_get_or_compute_encodes_only_misses(tmp_path, stub_encoder):
+    model = stub_encoder({"a": [1.0, 0.0], "b": [0.0, 1.0]})
+
+    first = get_or_compute(model, ["a"], "tag", tmp_path)
+    second = get_or_compute(model, ["a", "b"], "tag", tmp_path)
+
+    assert model.encoded == 2
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(second[1], [0.0, 1.0])
+
+
+def test_get_or_compute_without_cache_recomputes(tmp_path, stub_encoder):
+    model = stub_encoder({"a": [1.0, 0.0]})
+    get_or_compute(model, ["a"], "tag", tmp_path)
+    get_or_compute(model, ["a"], "tag", tmp_path, use_cache=False)
+    assert model.encoded == 2
+
+
+def test_get_or_compute_recomputes_truncated_entry(tmp_path, stub_encoder):
+    model = stub_encoder({"a": [1.0, 0.0]})
+    path = _cache_path(tmp_path, "tag", _content_hash("a"))
+    path.parent.mkdir(parents=True)
+    path.touch()
+
+    embeddings = get_or_compute(model, ["a"], "tag", tmp_path)
+
+    assert model.encoded == 1
+    np.testing.assert_array_equal(embeddings[0], [1.0, 0.0])
+    np.testing.assert_array_equal(np.load(path), [1.0, 0.0])
+    assert list(path.parent.iterdir()) == [path]
@@ -0,0 +1,15 @@
+from src.extraction.cache import JOB_DESCRIPTION_KIND, RESUME_KIND, extraction_cache_key
+
+
+def test_extraction_cache_key_is_namespaced_by_kind():
+    job_key = extraction_cache_key(JOB_DESCRIPTION_KIND, "text", "1")
+    resume_key = extraction_cache_key(RESUME_KIND, "text", "1")
+    assert job_key.startswith(f"{JOB_DESCRIPTION_KIND}_")
+    assert resume_key.startswith(f"{RESUME_KIND}_")
+    assert job_key.split("_")[-1] != resume_key.split("_")[-1]
+
+
+def test_extraction_cache_key_changes_with_prompt_version():
+    assert extraction_cache_key(RESUME_KIND, "text", "1") != extraction_cache_key(
+        RESUME_KIND, "text", "2"
+    )
@@ -0,0 +1,35 @@
+from src.utils.helpers import public_fields, safe_get_nested, safe_join
+
+
+def test_safe_join_joins_strings():
+    assert safe_join(["Python", "SQL", "Git"]) == "Python SQL Git"
+
+
+def test_safe_join_converts_non_strings():
+    assert safe_join(["Python", 3, None]) == "Python 3 None"
+
+
+def test_safe_join_consumes_iterators_once():
+    assert safe_join(iter(["a", 1, "b"])) == "a 1 b"
+    assert safe_join(str(n) for n in range(3)) == "0 1 2"
+
+
+def test_safe_join_falls_back_to_default():
+    assert safe_join(None) == ""
+    assert safe_join([]) == ""
+    assert safe_join([], default=["N/A"]) == "N/A"
+    assert safe_join(None, default=["N/A"]) == "N/A"
+    assert safe_join(iter([]), default=["N/A"]) == "N/A"
+
+
+def test_safe_get_nested_keeps_falsy_values():
+    data = {"a": {"count": 0, "name": "", "missing": None}}
+    assert safe_get_nested(data, "a", "count", default=5) == 0
+    assert safe_get_nested(data, "a", "name", default="x") == ""
+    assert safe_get_nested(data, "a", "missing", default="x") == "x"
+    assert safe_get_nested(data, "a", "absent", default="x") == "x"
+    assert safe_get_nested(data, "a", "count", "deeper", default="x") == "x"
+
+
+def test_public_fields_drops_underscore_keys():
+    assert public_fields({"name": "Jane", "_resume_id": "jane"}) == {"name": "Jane"}
@@ -0,0 +1,19 @@
+from src.ranking.llm_cache import judgment_cache_key
+from src.utils.json_cache import load_cached_json, save_cached_json
+
+
+def test_judgment_cache_key_ignores_internal_fields():
+    resume = {"professional_summary": "Engineer"}
+    assert judgment_cache_key("{}", {**resume, "_resume_id": "a"}) == (
+        judgment_cache_key("{}", {**resume, "_resume_id": "b"})
+    )
+    assert judgment_cache_key("{}", resume) != judgment_cache_key(
+        "{}", {"professional_summary": "Designer"}
+    )
+
+
+def test_json_cache_round_trip_skips_empty_results(tmp_path):
+    save_cached_json(tmp_path, "key", {"a": 1})
+    save_cached_json(tmp_path, "empty", {})
+    assert load_cached_json(tmp_path, "key") == {"a": 1}
+    assert load_cached_json(tmp_path, "empty") is None
@@ -0,0 +1,46 @@
+import pytest
+
+from src.models.schema import ExtractedJobRequirements, LLMJudgment, StructuredResume
+from src.utils.openai_batch import strict_json_schema
+
+MODELS = [LLMJudgment, StructuredResume, ExtractedJobRequirements]
+
+
+def _nodes(schema):
+    """Yield every schema node, including nested definitions."""
+    if isinstance(schema, dict):
+        yield schema
+        for value in schema.values():
+            yield from _nodes(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _nodes(value)
+
+
+@pytest.mark.parametrize("model_class", MODELS)
+def test_strict_json_schema_closes_every_object(model_class):
+    for node in _nodes(strict_json_schema(model_class)):
+        if node.get("type") == "object" and "properties" in node:
+            assert node["additionalProperties"] is False
+            assert node["required"] == list(node["properties"])
+
+
+@pytest.mark.parametrize("model_class", MODELS)
+def test_strict_json_schema_has_no_ref_siblings_or_null_defaults(model_class):
+    for node in _nodes(strict_json_schema(model_class)):
+        if "$ref" in node:
+            assert len(node) == 1
+        assert "allOf" not in node
+        assert not ("default" in node and node["default"] is None)
+
+
+def test_strict_json_schema_keeps_judgment_fields():
+    schema = strict_json_schema(LLMJudgment)
+    assert schema["required"] == list(LLMJudgment.model_fields)
+    assert schema["properties"]["final_score"]["maximum"] == 10
+
+
+def test_strict_json_schema_does_not_modify_pydantic_schema():
+    before = LLMJudgment.model_json_schema()
+    strict_json_schema(LLMJudgment)
+    assert LLMJudgment.model_json_schema() == before
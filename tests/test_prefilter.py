@@ -0,0 +1,116 @@
+import pytest
+
+from src.ranking.prefilter import (
+    MISSING_MUST_HAVE_MAX_SCORE,
+    hard_gate,
+    meets_requirement,
+    mentions_requirement,
+)
+
+
+def _job(skills=(), tools=(), education=()):
+    return {
+        "hard_requirements": {
+            "must_have_skills": list(skills),
+            "must_have_tools": list(tools),
+            "required_education": list(education),
+        }
+    }
+
+
+def _resume(languages=(), summary="", **extra):
+    return {
+        "professional_summary": summary,
+        "skills_section": {
+            "programming_languages": list(languages),
+            "frameworks_and_libraries": [],
+            "platforms_and_tools": [],
+        },
+        "work_experience": [],
+        **extra,
+    }
+
+
+def test_mentions_requirement_matches_whole_words_case_insensitively():
+    assert mentions_requirement("python", "Built services in Python 3")
+    assert mentions_requirement("C++", "Systems work in C++ and Rust")
+    assert mentions_requirement("Node.js", "node.js backend")
+
+
+def test_mentions_requirement_ignores_partial_words():
+    assert not mentions_requirement("Java", "Frontend in JavaScript")
+    assert not mentions_requirement("Go", "Worked at Google")
+    assert not mentions_requirement("R", "Ruby on Rails")
+    assert not mentions_requirement("C", "Wrote C++ and C#")
+
+
+def test_hard_gate_passes_resume_meeting_every_must_have():
+    job = _job(skills=["Python"], tools=["Docker"])
+    resume = _resume(
+        ["Python"], work_experience=[{"used_skills_and_tools": ["docker"]}]
+    )
+    assert hard_gate(job, resume) is None
+
+
+def test_hard_gate_scores_missing_must_haves_proportionally():
+    job = _job(skills=["Python", "SQL"], tools=["Docker"])
+    judgment = hard_gate(job, _resume(["Python"]))
+
+    assert judgment["final_score"] == MISSING_MUST_HAVE_MAX_SCORE / 3
+    assert judgment["cons"] == [
+        "Missing must-have requirement: SQL",
+        "Missing must-have requirement: Docker",
+    ]
+    assert [c["is_match"] for c in judgment["match_criteria"]] == [True, False, False]
+
+
+def test_hard_gate_does_not_search_field_names_or_internal_fields():
+    job = _job(skills=["skills_section", "jane"])
+    resume = _resume(_resume_id="jane")
+    assert hard_gate(job, resume)["final_score"] == 0
+
+
+def test_hard_gate_ignores_education_and_empty_requirements():
+    job = _job(skills=["Python", " "], education=["PhD in Physics"])
+    assert hard_gate(job, _resume(["Python"])) is None
+
+
+def test_hard_gate_passes_job_without_must_haves():
+    assert hard_gate({}, _resume()) is None
+
+
+def test_meets_requirement_matches_single_significant_token():
+    assert meets_requirement("Strong communication skills", "Communication")
+    assert meets_requirement("Experience with APIs", "Designed a REST API")
+    assert not meets_requirement("Strong communication skills", "Python")
+
+
+def test_meets_requirement_accepts_any_alternative():
+    assert meets_requirement("AWS/GCP", "Deployed on AWS")
+    assert meets_requirement("Kubernetes (K8s)", "Ran K8s clusters")
+    assert meets_requirement("Python or Go", "Go services")
+    assert not meets_requirement("Python or Go", "Java services")
+
+
+def test_meets_requirement_leaves_multi_word_phrases_to_the_judge():
+    assert meets_requirement("CI/CD pipelines", "Set up CI/CD")
+    assert meets_requirement("Excellent written and verbal communication", "Java")
+    assert meets_requirement("Experience with GraphQL APIs", "REST API")
+
+
+@pytest.mark.parametrize("mention", ["Kubernetes", "K8s"])
+def test_hard_gate_passes_resume_mentioning_either_alias(mention):
+    job = _job(skills=["Python"], tools=["Kubernetes (K8s)"])
+    resume = _resume(
+        ["Python"], work_experience=[{"used_skills_and_tools": [mention]}]
+    )
+    assert hard_gate(job, resume) is None
+
+
+def test_hard_gate_passes_resume_covering_multi_word_requirement():
+    job = _job(skills=["Experience with REST APIs", "Python or Go"])
+    resume = _resume(
+        ["Python"],
+        work_experience=[{"responsibilities": ["Built a REST API in Flask"]}],
+    )
+    assert hard_gate(job, resume) is None
@@ -0,0 +1,63 @@
+from src.ranking.trim import ELLIPSIS, _truncate, trim_resume
+
+
+def test_truncate_keeps_short_text():
+    assert _truncate("short text", 20) == "short text"
+
+
+def test_truncate_cuts_at_word_boundary_within_budget():
+    text = "alpha beta gamma delta"
+    truncated = _truncate(text, 15)
+    assert truncated == "alpha beta" + ELLIPSIS
+    assert len(truncated) <= 15
+
+
+def test_truncate_cuts_long_word():
+    assert _truncate("a" * 20, 10) == "a" * 7 + ELLIPSIS
+
+
+def test_truncate_ignores_surrounding_whitespace():
+    assert _truncate("  abcdef", 6) == "abcdef"
+    assert _truncate("  abcdefgh ij", 8) == "abcde" + ELLIPSIS
+
+
+def test_trim_resume_applies_field_budgets():
+    resume = {
+        "professional_summary": "word " * 50,
+        "projects": [{"project_name": "x" * 50, "description": "desc " * 50}],
+    }
+    trimmed = trim_resume(
+        resume, max_chars_per_field={"professional_summary": 30, "description": 20}
+    )
+
+    assert len(trimmed["professional_summary"]) <= 30
+    assert len(trimmed["projects"][0]["description"]) <= 20
+    # fields without a budget are left untouched
+    assert trimmed["projects"][0]["project_name"] == "x" * 50
+
+
+def test_trim_resume_shares_budget_across_list_items():
+    resume = {"work_experience": [{"achievements": ["a" * 30, "b" * 30, "c" * 30]}]}
+    trimmed = trim_resume(resume, max_chars_per_field={"achievements": 50})
+
+    achievements = trimmed["work_experience"][0]["achievements"]
+    assert achievements[0] == "a" * 30
+    assert len(achievements) == 2
+    assert sum(len(a) for a in achievements) <= 50
+
+
+def test_trim_resume_never_exceeds_budget_with_ellipsis():
+    trimmed = trim_resume({"achievements": ["a" * 49, "bbbbbb"]}, {"achievements": 50})
+    assert trimmed["achievements"] == ["a" * 49]
+
+
+def test_truncate_never_exceeds_budget_smaller_than_ellipsis():
+    assert _truncate("abcdef", 2) == "ab"
+    assert _truncate("abcdef", 0) == ""
+
+
+def test_trim_resume_does_not_modify_input():
+    resume = {"professional_summary": "word " * 200, "certifications": ["AWS"]}
+    original = {**resume, "certifications": list(resume["certifications"])}
+    trim_resume(resume)
+    assert resume == original